@@ -12,6 +12,9 @@ setup(
     install_requires=[
         'requests',
     ],
+    extras_require={
+        'fast': ['orjson'],
+    },
     entry_points={
         'console_scripts': [
             'bmctools=bmctools.cli.main:main',
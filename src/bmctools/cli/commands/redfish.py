@@ -563,7 +563,7 @@ def handle_raw(args: argparse.Namespace) -> dict:
     rf = establish_redfish_connection(args)
     response = rf.api.get(args.uri)
     if response.status_code == 200:
-        return response.json()
+        return rf.api.parse(response)
     else:
         raise ValueError(f'GET {args.uri} failed, status code: {response.status_code}\n{response.text}')
 
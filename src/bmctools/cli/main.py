@@ -65,6 +65,9 @@ For more information, visit: https://github.com/yourusername/bmctools
                        choices=['asus', 'dell', 'supermicro', 'gigabyte', 'cisco'],
                        help='Force manufacturer (env: BMC_MANUFACTURER)')
 
+    parser.add_argument('--no-cache', action='store_true', dest='no_meta_cache',
+                       help='Ignore the cached system ID and manufacturer for this BMC and re-detect them')
+
     parser.add_argument('-v', '--verbose', action='store_true',
                        help='Enable verbose output')
     parser.add_argument('-d', '--debug', action='store_true',
@@ -259,7 +259,8 @@ def establish_redfish_connection(args: argparse.Namespace):
             username=args.username,
             password=args.password,
             verify_ssl=not getattr(args, 'insecure', False),
-            manufacturer=getattr(args, 'manufacturer', None)
+            manufacturer=getattr(args, 'manufacturer', None),
+            nocache=getattr(args, 'no_cache', False) or getattr(args, 'no_meta_cache', False)
         )
 
         if not getattr(args, 'insecure', False):
@@ -270,7 +271,9 @@ def establish_redfish_connection(args: argparse.Namespace):
 
         print_verbose(f"Connected successfully", args)
         print_verbose(f"Manufacturer: {rf.manufacturer}", args)
-        print_verbose(f"System ID: {rf.system_id}", args)
+        if getattr(args, 'verbose', False):
+            # Formatting system_id resolves it, so only do so when shown
+            print_verbose(f"System ID: {rf.system_id}", args)
 
         return rf
     except Exception as e:
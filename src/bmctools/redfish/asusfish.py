@@ -27,7 +27,7 @@ class AsusFish:
         """
         response = self.api.get(f'/redfish/v1/Systems/Self')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             boot_order = data.get('Boot', {}).get('BootOrder', [])
             if not boot_order:
                 raise ValueError("BootOrder not found in response")
@@ -55,13 +55,13 @@ class AsusFish:
         
         response = self.api.get('/redfish/v1/Systems/Self/BootOptions')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             members = data.get('Members', [])
             boot_options = []
             for member in members:
                 option_response = self.api.get(member['@odata.id'])
                 if option_response.status_code == 200:
-                    option_data = option_response.json()
+                    option_data = self.api.parse(option_response)
                     boot_options.append(option_data)
             
             # Cache the boot options
@@ -179,7 +179,7 @@ class AsusFish:
         else:
             error_detail = ""
             try:
-                error_data = response.json()
+                error_data = self.api.parse(response)
                 error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
             except:
                 error_detail = f"\nResponse text: {response.text}"
@@ -213,7 +213,7 @@ class AsusFish:
         """Get the pending boot order from the FutureState (SD) endpoint."""
         response = self.api.get('/redfish/v1/Systems/Self/SD')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             boot_order = data.get('Boot', {}).get('BootOrder', [])
             return boot_order
         else:
@@ -228,7 +228,7 @@ class AsusFish:
         """
         response = self.api.get('/redfish/v1/Systems/Self')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             actions = data.get('Actions', {})
             
             # Try multiple possible keys for the reset action
@@ -297,7 +297,7 @@ class AsusFish:
         else:
             error_detail = ""
             try:
-                error_data = response.json()
+                error_data = self.api.parse(response)
                 error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
             except:
                 error_detail = f"\nResponse text: {response.text}"
@@ -392,7 +392,7 @@ class AsusFish:
         """
         response = self.api.get('/redfish/v1/UpdateService/FirmwareInventory')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             members = data.get('Members', [])
 
             firmware_list = []
@@ -404,7 +404,7 @@ class AsusFish:
                 try:
                     fw_resp = self.api.get(member_url)
                     if fw_resp.status_code == 200:
-                        fw_data = fw_resp.json()
+                        fw_data = self.api.parse(fw_resp)
                         firmware_list.append({
                             'Id': fw_data.get('Id'),
                             'Name': fw_data.get('Name'),
@@ -434,7 +434,7 @@ class AsusFish:
         """
         response = self.api.get('/redfish/v1/UpdateService')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             oem_data = data.get('Oem', {})
             ami_update = oem_data.get('AMIUpdateService', {})
             bmc_data = oem_data.get('BMC', {})
@@ -497,7 +497,7 @@ class AsusFish:
         else:
             error_detail = ""
             try:
-                error_data = response.json()
+                error_data = self.api.parse(response)
                 error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
             except:
                 error_detail = f"\nResponse text: {response.text}"
@@ -539,7 +539,7 @@ class AsusFish:
         else:
             error_detail = ""
             try:
-                error_data = response.json()
+                error_data = self.api.parse(response)
                 error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
             except:
                 error_detail = f"\nResponse text: {response.text}"
@@ -563,13 +563,13 @@ class AsusFish:
         if response.status_code != 200:
             raise ValueError(f'Failed to retrieve EthernetInterfaces, status code: {response.status_code}')
 
-        data = response.json()
+        data = self.api.parse(response)
         members = data.get('Members', [])
         interfaces = []
         for member in members:
             iface_resp = self.api.get(member['@odata.id'])
             if iface_resp.status_code == 200:
-                interfaces.append(iface_resp.json())
+                interfaces.append(self.api.parse(iface_resp))
 
         return interfaces
 
@@ -606,7 +606,7 @@ class AsusFish:
         else:
             error_detail = ""
             try:
-                error_data = response.json()
+                error_data = self.api.parse(response)
                 error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
             except:
                 error_detail = f"\nResponse text: {response.text}"
@@ -694,7 +694,7 @@ class AsusFish:
         if response.status_code != 200:
             raise ValueError(f'Failed to get BIOS settings, status code: {response.status_code}')
 
-        data = response.json()
+        data = self.api.parse(response)
         attributes = data.get('Attributes', {})
         setup006 = attributes.get('SETUP006')
         if setup006 is None:
@@ -733,7 +733,7 @@ class AsusFish:
         else:
             error_detail = ""
             try:
-                error_data = response.json()
+                error_data = self.api.parse(response)
                 error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
             except:
                 error_detail = f"\nResponse text: {response.text}"
@@ -816,11 +816,11 @@ class AsusFish:
         """
         response = self.api.get('/redfish/v1/Managers')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             members = data.get('Members', [])
             if members:
                 odata_id = members[0].get('@odata.id', '')
-                return odata_id.split('/')[-1] or 'Self'
+                return odata_id.rpartition('/')[2] or 'Self'
         return 'Self'
 
     def get_supported_bmc_reset_types(self) -> dict:
@@ -833,7 +833,7 @@ class AsusFish:
         manager_id = self._get_manager_id()
         response = self.api.get(f'/redfish/v1/Managers/{manager_id}')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             actions = data.get('Actions', {})
 
             reset_action = (actions.get('#Manager.Reset') or
@@ -870,7 +870,7 @@ class AsusFish:
         """
         response = self.api.get(action_info_uri)
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             for param in data.get('Parameters', []):
                 if param.get('Name') == 'ResetType':
                     return param.get('AllowableValues', [])
@@ -910,7 +910,7 @@ class AsusFish:
         else:
             error_detail = ""
             try:
-                error_data = response.json()
+                error_data = self.api.parse(response)
                 error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
             except:
                 error_detail = f"\nResponse text: {response.text}"
@@ -27,11 +27,11 @@ class CiscoFish:
         """Get the system ID from the Systems collection."""
         response = self.api.get('/redfish/v1/Systems')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             members = data.get('Members', [])
             if members and len(members) > 0:
                 odata_id = members[0].get('@odata.id', '')
-                system_id = odata_id.split('/')[-1]
+                system_id = odata_id.rpartition('/')[2]
                 return system_id if system_id else '1'
         return '1'
 
@@ -56,7 +56,7 @@ class CiscoFish:
         """
         response = self.api.get(self._system_uri())
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             actions = data.get('Actions', {})
 
             reset_action = (actions.get('#ComputerSystem.Reset') or
@@ -112,7 +112,7 @@ class CiscoFish:
         else:
             error_detail = ""
             try:
-                error_data = response.json()
+                error_data = self.api.parse(response)
                 error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
             except:
                 error_detail = f"\nResponse text: {response.text}"
@@ -129,11 +129,11 @@ class CiscoFish:
         """
         response = self.api.get('/redfish/v1/Managers')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             members = data.get('Members', [])
             if members:
                 odata_id = members[0].get('@odata.id', '')
-                return odata_id.split('/')[-1] or 'CIMC'
+                return odata_id.rpartition('/')[2] or 'CIMC'
         return 'CIMC'
 
     def get_supported_bmc_reset_types(self) -> dict:
@@ -146,7 +146,7 @@ class CiscoFish:
         manager_id = self._get_manager_id()
         response = self.api.get(f'/redfish/v1/Managers/{manager_id}')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             actions = data.get('Actions', {})
 
             reset_action = (actions.get('#Manager.Reset') or
@@ -176,7 +176,7 @@ class CiscoFish:
         """Fetch allowable values from a Redfish ActionInfo endpoint."""
         response = self.api.get(action_info_uri)
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             for param in data.get('Parameters', []):
                 if param.get('Name') == 'ResetType':
                     return param.get('AllowableValues', [])
@@ -216,7 +216,7 @@ class CiscoFish:
         else:
             error_detail = ""
             try:
-                error_data = response.json()
+                error_data = self.api.parse(response)
                 error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
             except:
                 error_detail = f"\nResponse text: {response.text}"
@@ -237,7 +237,7 @@ class CiscoFish:
         """
         response = self.api.get('/redfish/v1/UpdateService/FirmwareInventory')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             members = data.get('Members', [])
 
             firmware_list = []
@@ -248,7 +248,7 @@ class CiscoFish:
                 try:
                     fw_resp = self.api.get(member_url)
                     if fw_resp.status_code == 200:
-                        fw_data = fw_resp.json()
+                        fw_data = self.api.parse(fw_resp)
                         firmware_list.append({
                             'Id': fw_data.get('Id'),
                             'Name': fw_data.get('Name'),
@@ -282,12 +282,12 @@ class CiscoFish:
         if response.status_code != 200:
             raise ValueError(f'Failed to retrieve EthernetInterfaces, status code: {response.status_code}')
 
-        data = response.json()
+        data = self.api.parse(response)
         members = data.get('Members', [])
         interfaces = []
         for member in members:
             iface_resp = self.api.get(member['@odata.id'])
             if iface_resp.status_code == 200:
-                interfaces.append(iface_resp.json())
+                interfaces.append(self.api.parse(iface_resp))
 
         return interfaces
@@ -1,6 +1,49 @@
-import json
+import itertools
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
-from bmctools.redfish.fishapi import RedfishAPI
+from bmctools.redfish.fishapi import RedfishAPI, RedfishError, _normalize_mac
+
+# MAC address in colon/hyphen (48- or 64-bit), Cisco dotted or bare hex form
+_MAC_RE = re.compile(
+    r'\b(?:'
+    r'(?:[0-9A-Fa-f]{2}[:\-]){5}(?:[0-9A-Fa-f]{2}[:\-]){0,2}[0-9A-Fa-f]{2}'
+    r'|(?:[0-9A-Fa-f]{4}\.){2}[0-9A-Fa-f]{4}'
+    r'|[0-9A-Fa-f]{12}'
+    r')\b'
+)
+
+# DellAttributes key holding the name of iDRAC role N
+_ROLE_RE = re.compile(r'^Roles\.(\d+)\.Name$')
+
+
+# BIOS attribute names for the PxeDev1-4 slots: (EnDis, Interface, Protocol)
+_PXE_SLOT_KEYS = {
+    i: (f'PxeDev{i}EnDis', f'PxeDev{i}Interface', f'PxeDev{i}Protocol')
+    for i in range(1, 5)
+}
+
+
+def _pxe_slots(bios_attrs: dict) -> dict:
+    """Collect the PxeDev slots present in a BIOS attribute dict.
+
+    Args:
+        bios_attrs: BIOS attributes as returned by the Bios resource.
+
+    Returns:
+        Dict of slot number -> (enabled, interface, protocol) for each slot
+        the BIOS exposes, in slot order.
+    """
+    slots = {}
+    for i, (en_key, iface_key, proto_key) in _PXE_SLOT_KEYS.items():
+        enabled = bios_attrs.get(en_key)
+        # Skip if the BIOS doesn't have these attributes at all
+        if enabled is None and en_key not in bios_attrs:
+            continue
+        slots[i] = (enabled, bios_attrs.get(iface_key, ''), bios_attrs.get(proto_key, ''))
+    return slots
+
 
 class DellFish:
     """
@@ -17,24 +60,71 @@ class DellFish:
         """
         self.api = fishapi
         self.boot_options = None
-        self.system_id = self._get_system_id()
+        self._alias_exact = {}
+        self._alias_search = []
+        self._mac_index = None
+        self._system_doc = None
+        self._system_doc_exp = 0.0
+        self._manager_id = None
+        self._supported_reset_types = None
+        self._etags = {}
+        self._no_expand = set()
+        self._bios_attrs_cache = None
+        self._interfaces = None
+        self._system_id = None
+
+
+    @property
+    def system_id(self) -> str:
+        """The Dell system ID, looked up from the BMC on first access."""
+        if self._system_id is None:
+            self._system_id = self._get_system_id()
+        return self._system_id
 
     
     def _get_system_id(self) -> str:
         """Get the Dell system ID, typically 'System.Embedded.1'."""
         response = self.api.get('/redfish/v1/Systems')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             members = data.get('Members', [])
             if members and len(members) > 0:
                 # Extract system ID from @odata.id (e.g., '/redfish/v1/Systems/System.Embedded.1')
                 odata_id = members[0].get('@odata.id', '')
-                system_id = odata_id.split('/')[-1]
+                system_id = odata_id.rpartition('/')[2]
                 return system_id if system_id else 'System.Embedded.1'
         # Default to common Dell system ID
         return 'System.Embedded.1'
 
-    
+
+    def _get_system_doc(self, ttl: float = 2.0) -> dict:
+        """Get the System resource, reusing a recent snapshot when available.
+
+        Several read paths (boot order, reset types) need the same
+        ``/redfish/v1/Systems/{id}`` document. The snapshot is kept for *ttl*
+        seconds and is invalidated by any successful mutation on this object.
+
+        Args:
+            ttl: Seconds a fetched snapshot stays valid.
+
+        Returns:
+            The parsed System resource.
+
+        Raises:
+            ValueError: If the System resource cannot be retrieved.
+        """
+        if self._system_doc is not None and time.monotonic() < self._system_doc_exp:
+            return self._system_doc
+
+        response = self.api.get(f'/redfish/v1/Systems/{self.system_id}')
+        if response.status_code != 200:
+            raise ValueError(f'Failed to get system info, status code: {response.status_code}')
+
+        self._system_doc = self.api.parse(response)
+        self._system_doc_exp = time.monotonic() + ttl
+        return self._system_doc
+
+
     def get_boot_order(self) -> list:
         """Get the current boot order from the Dell system.
         
@@ -44,15 +134,11 @@ class DellFish:
         Raises:
             ValueError: If boot order cannot be retrieved
         """
-        response = self.api.get(f'/redfish/v1/Systems/{self.system_id}')
-        if response.status_code == 200:
-            data = response.json()
-            boot_order = data.get('Boot', {}).get('BootOrder', [])
-            if not boot_order:
-                raise ValueError("BootOrder not found in response")
-            return boot_order
-        else:
-            raise ValueError(f'Failed to retrieve boot order, status code: {response.status_code}')
+        data = self._get_system_doc()
+        boot_order = data.get('Boot', {}).get('BootOrder', [])
+        if not boot_order:
+            raise ValueError("BootOrder not found in response")
+        return boot_order
         
     
     def get_boot_options(self, nocache: bool = False) -> list:
@@ -71,22 +157,220 @@ class DellFish:
         if not nocache and self.boot_options is not None:
             return self.boot_options
         
-        response = self.api.get(f'/redfish/v1/Systems/{self.system_id}/BootOptions')
-        if response.status_code == 200:
-            data = response.json()
-            members = data.get('Members', [])
-            boot_options = []
-            for member in members:
-                option_response = self.api.get(member['@odata.id'])
-                if option_response.status_code == 200:
-                    option_data = option_response.json()
-                    boot_options.append(option_data)
-            
+        status, boot_options = self._get_collection_members(f'/redfish/v1/Systems/{self.system_id}/BootOptions')
+        if status == 200:
             # Cache the boot options
             self.boot_options = boot_options
+            self._index_boot_options(boot_options)
             return boot_options
         else:
-            raise ValueError(f'Failed to retrieve boot options, status code: {response.status_code}')
+            raise ValueError(f'Failed to retrieve boot options, status code: {status}')
+
+
+    def _get_collection_members(self, path: str) -> tuple:
+        """Get every member resource of a Redfish collection.
+
+        The collection is requested with ``$expand=.($levels=1)`` so the BMC
+        can inline all members in one response. Members that come back as
+        bare ``@odata.id`` links (older iDRAC firmware ignores ``$expand``)
+        are fetched individually. If the BMC rejects the query (400, 405 or
+        501) or answers it with bare links, it is not sent again for that
+        collection for the life of this instance; other errors only fall
+        back for the current call.
+
+        Args:
+            path: Redfish collection path.
+
+        Returns:
+            Tuple of (status code, list of member dicts). The list is None
+            if the collection itself cannot be read.
+        """
+        status, data = None, None
+        expanded = False
+        if path not in self._no_expand:
+            status, data = self._get_with_etag(f'{path}?$expand=.($levels=1)')
+            if status == 200:
+                expanded = True
+            elif status in (400, 405, 501):
+                self._no_expand.add(path)
+        if not expanded:
+            status, data = self._get_with_etag(path)
+            if status != 200:
+                return status, None
+
+        members = data.get('Members', [])
+        links = [m['@odata.id'] for m in members if not (m.keys() - {'@odata.id'})]
+        if expanded and links:
+            # The BMC accepted $expand but ignores it for this collection
+            self._no_expand.add(path)
+        fetched = dict(zip(links, self._get_many_with_etag(links)))
+
+        resolved = []
+        for member in members:
+            if member.keys() - {'@odata.id'}:
+                resolved.append(member)
+                continue
+            member_status, member_data = fetched[member['@odata.id']]
+            if member_status == 200:
+                resolved.append(member_data)
+        return 200, resolved
+
+
+    def _get_many_with_etag(self, paths: list, skip_errors: bool = False) -> list:
+        """GET several resources concurrently, revalidating earlier copies.
+
+        Args:
+            paths: Redfish resource paths.
+            skip_errors: If True, a request that fails at the transport level
+                or returns an unparseable body is reported as ``(None, None)``
+                instead of propagating the exception.
+
+        Returns:
+            List of (status code, parsed body) tuples in the same order as
+            *paths*, as returned by :meth:`_get_with_etag`.
+        """
+        headers = {}
+        for path in paths:
+            etag_headers = self._etag_headers(path)
+            if etag_headers:
+                headers[path] = etag_headers
+
+        results = []
+        for path, response in zip(paths, self.api.get_many(paths, headers=headers, skip_errors=skip_errors)):
+            if response is None:
+                results.append((None, None))
+                continue
+            try:
+                results.append(self._read_with_etag(path, response))
+            except ValueError:
+                if not skip_errors:
+                    raise
+                results.append((None, None))
+        return results
+
+
+    def _get_with_etag(self, path: str) -> tuple:
+        """GET a resource, revalidating any earlier copy with If-None-Match.
+
+        Resources returned with an ``ETag`` header are remembered by path. On
+        the next request the ETag is sent back, and a ``304 Not Modified``
+        reply is served from the stored copy instead of a full body.
+
+        Args:
+            path: Redfish resource path.
+
+        Returns:
+            Tuple of (status code, parsed body). A 304 is reported as 200 with
+            the stored body; the body is None for any other non-200 status.
+        """
+        return self._read_with_etag(path, self.api.get(path, headers=self._etag_headers(path)))
+
+
+    def _etag_headers(self, path: str) -> Optional[dict]:
+        """Return the If-None-Match header for a remembered resource, if any."""
+        cached = self._etags.get(path)
+        return {'If-None-Match': cached[0]} if cached else None
+
+
+    def _read_with_etag(self, path: str, response) -> tuple:
+        """Turn a (possibly conditional) GET response into (status, body).
+
+        See :meth:`_get_with_etag`.
+        """
+        cached = self._etags.get(path)
+        if response.status_code == 304 and cached:
+            return 200, cached[1]
+        if response.status_code != 200:
+            return response.status_code, None
+
+        data = self.api.parse(response)
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etags[path] = (etag, data)
+        return 200, data
+
+
+    def _index_boot_options(self, boot_options: list) -> None:
+        """Build the lowercase alias lookups for a freshly fetched boot option list.
+
+        ``_alias_exact`` maps a lowercased DisplayName or Name to its option,
+        and ``_alias_search`` pairs each option with its lowercased
+        DisplayName, Name and Description joined by NUL so a single substring
+        test covers all three fields.
+        """
+        self._alias_exact = {}
+        self._alias_search = []
+        self._mac_index = None
+        for option in boot_options:
+            display_name = (option.get('DisplayName') or '').lower()
+            name = (option.get('Name') or '').lower()
+            description = (option.get('Description') or '').lower()
+            for key in (display_name, name):
+                if key:
+                    self._alias_exact.setdefault(key, option)
+            self._alias_search.append((f'{display_name}\0{name}\0{description}', option))
+
+
+    def _build_mac_index(self, boot_options: list) -> dict:
+        """Map every NIC MAC address linked to a boot option back to its options.
+
+        Args:
+            boot_options: Boot option dicts as returned by :meth:`get_boot_options`.
+
+        Returns:
+            Dict of normalized MAC -> list of boot options, in boot option order.
+        """
+        # Dell exposes the NIC association in RelatedItem. Flatten every
+        # (option, related item) pair up front, then fetch all linked
+        # NetworkDeviceFunction (or related) resources concurrently
+        pairs = [
+            (option, rel)
+            for option in boot_options
+            for rel in (option.get('RelatedItem') or [])
+            # Parsed JSON only ever yields plain dicts, so an exact type check suffices
+            if type(rel) is dict and rel.get('@odata.id')
+        ]
+        links = list(dict.fromkeys(
+            rel['@odata.id'] for _, rel in pairs if not (rel.keys() - {'@odata.id'})
+        ))
+        fetched = dict(zip(links, self._get_many_with_etag(links, skip_errors=True)))
+
+        index = {}
+        for option, rel in pairs:
+            if rel.keys() - {'@odata.id'}:
+                # Already expanded inline by the BMC
+                rel_data = rel
+            else:
+                rel_status, rel_data = fetched[rel['@odata.id']]
+                if rel_status != 200:
+                    continue
+
+            # Look for MAC address in common locations
+            mac_candidates = []
+            eth = rel_data.get('Ethernet') or {}
+            if type(eth) is dict:
+                if eth.get('MACAddress'):
+                    mac_candidates.append(eth.get('MACAddress'))
+                if eth.get('PermanentMACAddress'):
+                    mac_candidates.append(eth.get('PermanentMACAddress'))
+
+            # Some Dell OEM data may include MAC under Oem -> Dell -> DellNIC -> ProductName or similar
+            oem = rel_data.get('Oem') or {}
+            dell = (oem.get('Dell') or {}) if type(oem) is dict else {}
+            dell_nic = (dell.get('DellNIC') or {}) if type(dell) is dict else {}
+            oem_mac = dell_nic.get('ProductName') if type(dell_nic) is dict else None
+            # ProductName sometimes includes the MAC (e.g. at the end after a dash)
+            if oem_mac and type(oem_mac) is str:
+                for m in _MAC_RE.finditer(oem_mac):
+                    mac_candidates.append(m.group(0))
+
+            for cand in mac_candidates:
+                if cand:
+                    options = index.setdefault(_normalize_mac(cand), [])
+                    if not any(o is option for o in options):
+                        options.append(option)
+
+        return index
 
 
     def get_boot_option_by_mac(self, mac_address: str, type: Optional[str] = None, nocache: bool = False) -> dict:
@@ -103,68 +387,17 @@ class DellFish:
         Raises:
             ValueError: If no boot option is found with the specified MAC address or type
         """
-        # Normalize MAC address to uppercase without separators
-        def normalize(mac: str) -> str:
-            return mac.replace(':', '').replace('-', '').upper()
-
-        target = normalize(mac_address)
+        target = _normalize_mac(mac_address)
 
         boot_options = self.get_boot_options(nocache=nocache)
+        if self._mac_index is None:
+            self._mac_index = self._build_mac_index(boot_options)
 
-        for option in boot_options:
-            # Dell exposes the NIC association in RelatedItem; follow those links
-            related = option.get('RelatedItem', []) or []
-            for rel in related:
-                rel_id = rel.get('@odata.id') if isinstance(rel, dict) else None
-                if not rel_id:
-                    continue
-
-                # Retrieve the NetworkDeviceFunction (or related) resource
-                try:
-                    rel_resp = self.api.get(rel_id)
-                except Exception:
-                    rel_resp = None
-
-                if not rel_resp or rel_resp.status_code != 200:
-                    # some RelatedItem entries may point to containers; try expanding if present
-                    continue
-
-                try:
-                    rel_data = rel_resp.json()
-                except Exception:
-                    continue
-
-                # Look for MAC address in common locations
-                mac_candidates = []
-                eth = rel_data.get('Ethernet') or {}
-                if isinstance(eth, dict):
-                    if eth.get('MACAddress'):
-                        mac_candidates.append(eth.get('MACAddress'))
-                    if eth.get('PermanentMACAddress'):
-                        mac_candidates.append(eth.get('PermanentMACAddress'))
-
-                # Some Dell OEM data may include MAC under Oem -> Dell -> DellNIC -> ProductName or similar
-                try:
-                    oem_mac = (
-                        rel_data.get('Oem', {})
-                        .get('Dell', {})
-                        .get('DellNIC', {})
-                        .get('ProductName')
-                    )
-                    # ProductName sometimes includes the MAC at the end after a dash
-                    if oem_mac and isinstance(oem_mac, str) and ':' in oem_mac:
-                        # extract last token with colons
-                        token = oem_mac.split()[-1]
-                        mac_candidates.append(token)
-                except Exception:
-                    pass
-
-                for cand in mac_candidates:
-                    if cand and normalize(cand) == target:
-                        # Check type if specified
-                        if type and option.get('BootOptionType') is not None and option.get('BootOptionType', '').lower() != type.lower():
-                            continue
-                        return option
+        for option in self._mac_index.get(target, ()):
+            # Check type if specified
+            if type and option.get('BootOptionType') is not None and option.get('BootOptionType', '').lower() != type.lower():
+                continue
+            return option
 
         raise ValueError(f'No boot option found with MAC address: {mac_address}' + (f' and type: {type}' if type else ''))
 
@@ -182,21 +415,23 @@ class DellFish:
         Raises:
             ValueError: If no boot option is found with the specified alias
         """
-        boot_options = self.get_boot_options(nocache=nocache)
+        self.get_boot_options(nocache=nocache)
         alias_lower = alias.lower()
-        
-        for option in boot_options:
-            display_name = option.get('DisplayName', '').lower()
-            name = option.get('Name', '').lower()
-            description = option.get('Description', '').lower()
-            
-            if alias_lower in display_name or alias_lower in name or alias_lower in description:
+
+        # An exact DisplayName/Name match takes precedence over substring matches
+        option = self._alias_exact.get(alias_lower)
+        if option is not None:
+            return option
+
+        for search_blob, option in self._alias_search:
+            if alias_lower in search_blob:
                 return option
-        
+
         raise ValueError(f'No boot option found with alias: {alias}')
 
 
-    def set_boot_order(self, boot_order: list) -> dict:
+    def set_boot_order(self, boot_order: list, current_boot_order: Optional[list] = None,
+                       validate: bool = True) -> dict:
         """Set the boot order for the Dell system.
 
         Dell systems use PATCH operations on the System resource to update boot order.
@@ -204,6 +439,10 @@ class DellFish:
         Args:
             boot_order: List of boot option references (e.g., ["Boot0003", "Boot0004", ...])
                         Must include ALL boot options, not just a subset.
+            current_boot_order: The current boot order, if the caller has just
+                        read it. When omitted, it is read fresh from the BMC.
+            validate: If False, skip checking *boot_order* against the current
+                        boot options (for trusted callers).
 
         Returns:
             Dict with keys: changed, needs_reboot, previous_boot_order, boot_order.
@@ -212,28 +451,32 @@ class DellFish:
             ValueError: If the boot order doesn't include all required boot options or update fails
         """
         # Get the current boot order to validate the new one
-        current_boot_order = self.get_boot_order()
-
-        # Validate that the new boot order has the same number of entries
-        if len(boot_order) != len(current_boot_order):
-            raise ValueError(
-                f'Boot order must contain all {len(current_boot_order)} boot options. '
-                f'You provided {len(boot_order)}. '
-                f'Current boot options: {current_boot_order}'
-            )
+        if current_boot_order is None:
+            # Never decide against a snapshot: the order may have changed on the BMC
+            self._system_doc_exp = 0.0
+            current_boot_order = self.get_boot_order()
+
+        if validate:
+            # Validate that the new boot order has the same number of entries
+            if len(boot_order) != len(current_boot_order):
+                raise ValueError(
+                    f'Boot order must contain all {len(current_boot_order)} boot options. '
+                    f'You provided {len(boot_order)}. '
+                    f'Current boot options: {current_boot_order}'
+                )
 
-        # Validate that all entries in the new boot order exist in current boot order
-        current_set = set(current_boot_order)
-        new_set = set(boot_order)
-        if new_set != current_set:
-            missing = current_set - new_set
-            extra = new_set - current_set
-            error_msg = 'Boot order validation failed.'
-            if missing:
-                error_msg += f' Missing options: {sorted(missing)}.'
-            if extra:
-                error_msg += f' Unknown options: {sorted(extra)}.'
-            raise ValueError(error_msg)
+            # Validate that all entries in the new boot order exist in current boot order
+            current_set = frozenset(current_boot_order)
+            if current_set.symmetric_difference(boot_order):
+                new_set = frozenset(boot_order)
+                missing = current_set - new_set
+                extra = new_set - current_set
+                error_msg = 'Boot order validation failed.'
+                if missing:
+                    error_msg += f' Missing options: {sorted(missing)}.'
+                if extra:
+                    error_msg += f' Unknown options: {sorted(extra)}.'
+                raise ValueError(error_msg)
 
         # Skip PATCH if the order is already correct
         if boot_order == current_boot_order:
@@ -255,8 +498,13 @@ class DellFish:
 
         response = self.api.patch(endpoint, data=payload)
         if response.status_code in [200, 202, 204]:
-            # Clear cached boot options as they may have changed
+            # Clear cached boot options and system snapshot as they may have changed
             self.boot_options = None
+            self._alias_exact = {}
+            self._alias_search = []
+            self._mac_index = None
+            self._system_doc_exp = 0.0
+            self._bios_attrs_cache = None
             return {
                 'changed': True,
                 'needs_reboot': True,
@@ -264,13 +512,7 @@ class DellFish:
                 'boot_order': boot_order,
             }
         else:
-            error_detail = ""
-            try:
-                error_data = response.json()
-                error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
-            except:
-                error_detail = f"\nResponse text: {response.text}"
-            raise ValueError(f'Failed to set boot order, status code: {response.status_code}{error_detail}')
+            raise RedfishError('Failed to set boot order', response)
 
 
     def set_boot_first_by_mac(self, mac_address: str, boot_type: str = None) -> dict:
@@ -303,6 +545,8 @@ class DellFish:
         # Move to front, keep the rest in existing order
         new_order = [boot_ref] + [b for b in current_order if b != boot_ref]
 
+        # set_boot_order re-reads the order itself, so a change since the read
+        # above is validated (or detected as already done) on fresh data
         result = self.set_boot_order(new_order)
 
         return {
@@ -334,14 +578,23 @@ class DellFish:
         Returns:
             Dict with action taken and details
         """
-        # Verify the NIC exists
-        self._find_interface_by_mac(mac_address)
-
-        # Check if a PXE boot option already exists for this MAC
-        try:
-            option = self.get_boot_option_by_mac(mac_address, type='PXE')
-        except ValueError:
-            option = None
+        def find_pxe_option():
+            try:
+                return self.get_boot_option_by_mac(mac_address, type='PXE')
+            except ValueError:
+                return None
+
+        # Both reads below need the lazily looked-up system ID; resolve it here
+        # so the two threads don't each fetch it
+        if self._system_id is None:
+            self._system_id = self._get_system_id()
+
+        # Verify the NIC exists and check if a PXE boot option already exists
+        # for this MAC. The two reads hit unrelated collections, so overlap them.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(find_pxe_option)
+            self._find_interface_by_mac(mac_address)
+            option = pending.result()
 
         if option:
             # PXE already enabled — just reorder
@@ -364,7 +617,8 @@ class DellFish:
         }
 
         if reboot:
-            # Set one-time boot to PXE so it PXE boots after reboot
+            # Set one-time boot to PXE only once the BIOS change is staged, so
+            # a validation failure above leaves the operator's override alone
             self.set_next_onetime_boot('Pxe')
             self.reset_system('GracefulRestart')
             result['rebooted'] = True
@@ -405,15 +659,10 @@ class DellFish:
         
         response = self.api.patch(f'/redfish/v1/Systems/{self.system_id}', data=payload)
         if response.status_code in [200, 204]:
+            self._system_doc_exp = 0.0
             return True
         else:
-            error_detail = ""
-            try:
-                error_data = response.json()
-                error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
-            except:
-                error_detail = f"\nResponse text: {response.text}"
-            raise ValueError(f'Failed to set one-time boot, status code: {response.status_code}{error_detail}')
+            raise RedfishError('Failed to set one-time boot', response)
 
 
     def get_supported_reset_types(self) -> dict:
@@ -422,28 +671,25 @@ class DellFish:
         Returns:
             Dict with 'types' (list of allowed types) and 'actions' (full actions data)
         """
-        response = self.api.get(f'/redfish/v1/Systems/{self.system_id}')
-        if response.status_code == 200:
-            data = response.json()
-            actions = data.get('Actions', {})
-            
-            # Try multiple possible keys for the reset action
-            reset_action = (actions.get('#ComputerSystem.Reset') or 
-                          actions.get('ComputerSystem.Reset') or
-                          {})
-            
-            # Try multiple possible keys for allowable values
-            allowed_values = (reset_action.get('ResetType@Redfish.AllowableValues') or
-                            reset_action.get('AllowableValues') or
-                            [])
-            
-            return {
-                'types': allowed_values,
-                'actions': actions,
-                'reset_action': reset_action
-            }
-        else:
-            raise ValueError(f'Failed to get system info, status code: {response.status_code}')
+        data = self._get_system_doc()
+        actions = data.get('Actions', {})
+
+        # Try multiple possible keys for the reset action
+        reset_action = (actions.get('#ComputerSystem.Reset') or
+                      actions.get('ComputerSystem.Reset') or
+                      {})
+
+        # Try multiple possible keys for allowable values
+        allowed_values = (reset_action.get('ResetType@Redfish.AllowableValues') or
+                        reset_action.get('AllowableValues') or
+                        [])
+        self._supported_reset_types = frozenset(allowed_values)
+
+        return {
+            'types': allowed_values,
+            'actions': actions,
+            'reset_action': reset_action
+        }
 
 
     def reset_system(self, reset_type: str = None) -> bool:
@@ -465,12 +711,13 @@ class DellFish:
         if reset_type is None:
             reset_type = 'GracefulRestart'
         
-        # Validate reset type
-        supported = self.get_supported_reset_types()
-        if supported['types'] and reset_type not in supported['types']:
+        # Validate reset type; the supported set is fetched once per session
+        if self._supported_reset_types is None:
+            self.get_supported_reset_types()
+        if self._supported_reset_types and reset_type not in self._supported_reset_types:
             raise ValueError(
                 f"Reset type '{reset_type}' not supported. "
-                f"Supported types: {supported['types']}"
+                f"Supported types: {sorted(self._supported_reset_types)}"
             )
         
         payload = {
@@ -483,15 +730,11 @@ class DellFish:
         )
         
         if response.status_code in [200, 204]:
+            self._system_doc_exp = 0.0
+            self._bios_attrs_cache = None
             return True
         else:
-            error_detail = ""
-            try:
-                error_data = response.json()
-                error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
-            except:
-                error_detail = f"\nResponse text: {response.text}"
-            raise ValueError(f'Failed to reset system, status code: {response.status_code}{error_detail}')
+            raise RedfishError('Failed to reset system', response)
 
 
     # ── BMC (Manager) Reset ──────────────────────────────────────────
@@ -499,17 +742,48 @@ class DellFish:
     def _get_manager_id(self) -> str:
         """Get the Manager ID (iDRAC) from the Managers collection.
 
+        The ID is cached after the first successful lookup since it does not
+        change without a BMC reset; see :meth:`invalidate_cache`.
+
         Returns:
             Manager ID string (e.g., 'iDRAC.Embedded.1').
+
+        Raises:
+            ValueError: If the Managers collection cannot be read or is empty.
         """
+        if self._manager_id is not None:
+            return self._manager_id
+
         response = self.api.get('/redfish/v1/Managers')
-        if response.status_code == 200:
-            data = response.json()
-            members = data.get('Members', [])
-            if members:
-                odata_id = members[0].get('@odata.id', '')
-                return odata_id.split('/')[-1] or 'iDRAC.Embedded.1'
-        return 'iDRAC.Embedded.1'
+        if response.status_code != 200:
+            raise ValueError(f'Failed to list Managers, status code: {response.status_code}')
+
+        members = self.api.parse(response).get('Members', [])
+        if not members:
+            raise ValueError('No Managers found')
+
+        odata_id = members[0].get('@odata.id', '')
+        self._manager_id = odata_id.rpartition('/')[2] or 'iDRAC.Embedded.1'
+        return self._manager_id
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached BMC state held by this instance.
+
+        Call this after events that can change otherwise static data, such
+        as an iDRAC reset or firmware update.
+        """
+        self.boot_options = None
+        self._alias_exact = {}
+        self._alias_search = []
+        self._mac_index = None
+        self._system_doc = None
+        self._system_doc_exp = 0.0
+        self._manager_id = None
+        self._supported_reset_types = None
+        self._etags = {}
+        self._no_expand = set()
+        self._bios_attrs_cache = None
+        self._interfaces = None
 
     def get_supported_bmc_reset_types(self) -> dict:
         """Get the list of supported reset types for the BMC (iDRAC Manager).
@@ -521,7 +795,7 @@ class DellFish:
         manager_id = self._get_manager_id()
         response = self.api.get(f'/redfish/v1/Managers/{manager_id}')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             actions = data.get('Actions', {})
 
             reset_action = (actions.get('#Manager.Reset') or
@@ -551,7 +825,7 @@ class DellFish:
         """Fetch allowable values from a Redfish ActionInfo endpoint."""
         response = self.api.get(action_info_uri)
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             for param in data.get('Parameters', []):
                 if param.get('Name') == 'ResetType':
                     return param.get('AllowableValues', [])
@@ -589,13 +863,58 @@ class DellFish:
         if response.status_code in [200, 202, 204]:
             return True
         else:
-            error_detail = ""
+            raise RedfishError('Failed to reset BMC', response)
+
+
+    def _dell_attributes_path(self) -> str:
+        """Return the DellAttributes endpoint for the first Manager (iDRAC)."""
+        mgr_id = self._get_manager_id()
+        return f'/redfish/v1/Managers/{mgr_id}/Oem/Dell/DellAttributes/{mgr_id}'
+
+
+    def _patch_dell_attributes(self, attrs: dict, action: str = 'apply DellAttributes') -> dict:
+        """PATCH a set of iDRAC DellAttributes in a single request.
+
+        Args:
+            attrs: Attribute name -> value pairs to apply.
+            action: Short description used in the error message.
+
+        Returns:
+            The response JSON, or an empty dict if the body is empty.
+
+        Raises:
+            ValueError: on failure to apply the change.
+        """
+        resp = self.api.patch(self._dell_attributes_path(), data={'Attributes': attrs})
+        if resp.status_code in [200, 204]:
+            # try to return any JSON body if present
             try:
-                error_data = response.json()
-                error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
-            except:
-                error_detail = f"\nResponse text: {response.text}"
-            raise ValueError(f'Failed to reset BMC, status code: {response.status_code}{error_detail}')
+                return self.api.parse(resp)
+            except Exception:
+                return {}
+        else:
+            raise RedfishError(f'Failed to {action}', resp)
+
+
+    def apply_dell_attributes(self, attributes: dict) -> dict:
+        """Apply arbitrary iDRAC DellAttributes in one PATCH.
+
+        Independent attribute changes (e.g. a new role plus local access
+        settings) should be merged into a single call here rather than
+        issued one at a time, so the iDRAC applies them together.
+
+        Args:
+            attributes: Attribute name -> value pairs
+                (e.g. ``{'LocalSecurity.1.LocalConfig': 'Enabled'}``).
+
+        Returns:
+            Dict with the applied values and the response data (if any).
+
+        Raises:
+            ValueError: on failure to apply the change.
+        """
+        data = self._patch_dell_attributes(attributes)
+        return {'applied': dict(attributes), 'response': data}
 
 
     def create_user_group(self, role_name: str, privileges: int) -> dict:
@@ -615,69 +934,26 @@ class DellFish:
         Raises:
             ValueError: on failure to apply the change.
         """
-        # Find manager id
-        mgr_resp = self.api.get('/redfish/v1/Managers')
-        if mgr_resp.status_code != 200:
-            raise ValueError(f'Failed to list Managers, status code: {mgr_resp.status_code}')
-
-        mgr_data = mgr_resp.json()
-        members = mgr_data.get('Members', [])
-        if not members:
-            raise ValueError('No Managers found')
-
-        # Use the first manager by default
-        mgr_odata = members[0].get('@odata.id', '')
-        mgr_id = mgr_odata.split('/')[-1] if mgr_odata else 'iDRAC.Embedded.1'
-
-        attrs_path = f'/redfish/v1/Managers/{mgr_id}/Oem/Dell/DellAttributes/{mgr_id}'
+        attrs_path = self._dell_attributes_path()
 
         # Try to read existing attributes to find used role indices
         used_indices = set()
         get_attrs = self.api.get(attrs_path)
         if get_attrs.status_code == 200:
             try:
-                attrs = get_attrs.json().get('Attributes', {})
-                for key in attrs.keys():
-                    # match Roles.<N>.Name
-                    if key.startswith('Roles.') and key.endswith('.Name'):
-                        parts = key.split('.')
-                        if len(parts) >= 3:
-                            try:
-                                idx = int(parts[1])
-                                used_indices.add(idx)
-                            except Exception:
-                                pass
+                attrs = self.api.parse(get_attrs).get('Attributes', {})
+                used_indices = {int(m.group(1)) for key in attrs if (m := _ROLE_RE.match(key))}
             except Exception:
                 used_indices = set()
 
         # choose smallest available index >=4
-        start = 4
-        idx = start
-        while idx in used_indices:
-            idx += 1
+        idx = next(i for i in itertools.count(4) if i not in used_indices)
 
-        payload = {
-            'Attributes': {
-                f'Roles.{idx}.Name': role_name,
-                f'Roles.{idx}.Privileges': privileges,
-            }
-        }
-
-        resp = self.api.patch(attrs_path, data=payload)
-        if resp.status_code in [200, 204]:
-            # try to return any JSON body if present
-            try:
-                data = resp.json()
-            except Exception:
-                data = {}
-            return {'role_index': idx, 'response': data}
-        else:
-            detail = ''
-            try:
-                detail = json.dumps(resp.json(), indent=2)
-            except Exception:
-                detail = resp.text
-            raise ValueError(f'Failed to create user group, status: {resp.status_code}, detail: {detail}')
+        data = self._patch_dell_attributes({
+            f'Roles.{idx}.Name': role_name,
+            f'Roles.{idx}.Privileges': privileges,
+        }, action='create user group')
+        return {'role_index': idx, 'response': data}
 
 
     def toggle_local_idrac_access(self, disable: bool) -> dict:
@@ -694,6 +970,9 @@ class DellFish:
           - LocalSecurity.1.PrebootConfig: "Enabled" / "Disabled"
           - LocalSecurity.1.LocalConfig: "Enabled" / "Disabled"
 
+        To combine this with other attribute changes in one request, use
+        :meth:`apply_dell_attributes`.
+
         Args:
             disable: True to disable local access, False to enable it.
 
@@ -703,45 +982,15 @@ class DellFish:
         Raises:
             ValueError: on failure to apply the change.
         """
-        # Find manager id
-        mgr_resp = self.api.get('/redfish/v1/Managers')
-        if mgr_resp.status_code != 200:
-            raise ValueError(f'Failed to list Managers, status code: {mgr_resp.status_code}')
-
-        mgr_data = mgr_resp.json()
-        members = mgr_data.get('Members', [])
-        if not members:
-            raise ValueError('No Managers found')
-
-        mgr_odata = members[0].get('@odata.id', '')
-        mgr_id = mgr_odata.split('/')[-1] if mgr_odata else 'iDRAC.Embedded.1'
-
-        attrs_path = f'/redfish/v1/Managers/{mgr_id}/Oem/Dell/DellAttributes/{mgr_id}'
-
         # Inverted semantics: 'Enabled' will disable local access
         value = 'Enabled' if disable else 'Disabled'
 
-        payload = {
-            'Attributes': {
-                'LocalSecurity.1.PrebootConfig': value,
-                'LocalSecurity.1.LocalConfig': value,
-            }
+        applied = {
+            'LocalSecurity.1.PrebootConfig': value,
+            'LocalSecurity.1.LocalConfig': value,
         }
-
-        resp = self.api.patch(attrs_path, data=payload)
-        if resp.status_code in [200, 204]:
-            try:
-                data = resp.json()
-            except Exception:
-                data = {}
-            return {'applied': {'LocalSecurity.1.PrebootConfig': value, 'LocalSecurity.1.LocalConfig': value}, 'response': data}
-        else:
-            detail = ''
-            try:
-                detail = json.dumps(resp.json(), indent=2)
-            except Exception:
-                detail = resp.text
-            raise ValueError(f'Failed to toggle local iDRAC access, status: {resp.status_code}, detail: {detail}')
+        data = self._patch_dell_attributes(applied, action='toggle local iDRAC access')
+        return {'applied': applied, 'response': data}
 
 
     def _create_dell_bios_job(self, target_settings_uri: str) -> str:
@@ -750,18 +999,7 @@ class DellFish:
         Returns the job URI (e.g. '/redfish/v1/Managers/iDRAC.Embedded.1/Oem/Dell/Jobs/JID_...')
         or raises ValueError on failure.
         """
-        # Find manager id
-        mgr_resp = self.api.get('/redfish/v1/Managers')
-        if mgr_resp.status_code != 200:
-            raise ValueError(f'Failed to list Managers, status code: {mgr_resp.status_code}')
-
-        mgr_data = mgr_resp.json()
-        members = mgr_data.get('Members', [])
-        if not members:
-            raise ValueError('No Managers found')
-
-        mgr_odata = members[0].get('@odata.id', '')
-        mgr_id = mgr_odata.split('/')[-1] if mgr_odata else 'iDRAC.Embedded.1'
+        mgr_id = self._get_manager_id()
 
         jobs_path = f'/redfish/v1/Managers/{mgr_id}/Oem/Dell/Jobs'
 
@@ -778,7 +1016,7 @@ class DellFish:
             if loc:
                 return loc
             try:
-                body = resp.json()
+                body = self.api.parse(resp)
                 if isinstance(body, dict):
                     if body.get('@odata.id'):
                         return body.get('@odata.id')
@@ -791,20 +1029,18 @@ class DellFish:
             # Fallback: return the collection path to indicate submission
             return jobs_path
         else:
-            detail = ''
-            try:
-                detail = json.dumps(resp.json(), indent=2)
-            except Exception:
-                detail = getattr(resp, 'text', str(resp))
-            raise ValueError(f'Failed to create Dell BIOS job, status: {resp.status_code}, detail: {detail}')
+            raise RedfishError('Failed to create Dell BIOS job', resp)
 
 
-    def get_network_interfaces(self) -> list:
+    def get_network_interfaces(self, nocache: bool = False) -> list:
         """Get NIC information including MAC addresses from the Dell system.
 
         Queries the EthernetInterfaces collection under the system resource
         and returns details for each interface.
 
+        Args:
+            nocache: If True, force a fresh API call instead of using cached interfaces
+
         Returns:
             List of dicts, each containing interface details (Id, Name,
             MACAddress, SpeedMbps, Status, etc.)
@@ -812,18 +1048,14 @@ class DellFish:
         Raises:
             ValueError: If the interfaces cannot be retrieved
         """
-        response = self.api.get(f'/redfish/v1/Systems/{self.system_id}/EthernetInterfaces')
-        if response.status_code != 200:
-            raise ValueError(f'Failed to retrieve EthernetInterfaces, status code: {response.status_code}')
+        if not nocache and self._interfaces is not None:
+            return self._interfaces
 
-        data = response.json()
-        members = data.get('Members', [])
-        interfaces = []
-        for member in members:
-            iface_resp = self.api.get(member['@odata.id'])
-            if iface_resp.status_code == 200:
-                interfaces.append(iface_resp.json())
+        status, interfaces = self._get_collection_members(f'/redfish/v1/Systems/{self.system_id}/EthernetInterfaces')
+        if status != 200:
+            raise ValueError(f'Failed to retrieve EthernetInterfaces, status code: {status}')
 
+        self._interfaces = interfaces
         return interfaces
 
 
@@ -840,11 +1072,11 @@ class DellFish:
             ValueError: If no interface matches
         """
         interfaces = self.get_network_interfaces()
-        target_mac = mac_address.replace(':', '').replace('-', '').upper()
+        target_mac = _normalize_mac(mac_address)
 
+        normalize = _normalize_mac
         for iface in interfaces:
-            iface_mac = (iface.get('MACAddress') or '').replace(':', '').replace('-', '').upper()
-            if iface_mac == target_mac:
+            if normalize(iface.get('MACAddress') or '') == target_mac:
                 return iface
 
         raise ValueError(f'No NIC found with MAC address: {mac_address}')
@@ -863,7 +1095,7 @@ class DellFish:
         chassis_id = 'System.Embedded.1'
         chassis_link = iface.get('Links', {}).get('Chassis', {}).get('@odata.id', '')
         if chassis_link:
-            chassis_id = chassis_link.split('/')[-1]
+            chassis_id = chassis_link.rpartition('/')[2]
 
         adapter_id = nic_id.split('-')[0]
 
@@ -895,26 +1127,36 @@ class DellFish:
                 f'status: {response.status_code}'
             )
 
-        data = response.json()
+        data = self.api.parse(response)
         return {
             'nic_id': iface['Id'],
             'mac_address': mac_address,
             'attributes': data.get('Attributes', {})
         }
 
-    def _get_bios_attributes(self) -> dict:
+    def _get_bios_attributes(self, nocache: bool = False) -> dict:
         """Get current BIOS attributes.
 
+        The attributes are cached until a BIOS or boot settings PATCH, a
+        system reset, or :meth:`invalidate_cache`.
+
+        Args:
+            nocache: If True, force a fresh API call instead of using cached attributes
+
         Returns:
             Dict of BIOS attribute name -> value
 
         Raises:
             ValueError: If BIOS attributes cannot be retrieved
         """
+        if not nocache and self._bios_attrs_cache is not None:
+            return self._bios_attrs_cache
+
         response = self.api.get(f'/redfish/v1/Systems/{self.system_id}/Bios')
         if response.status_code != 200:
             raise ValueError(f'Failed to get BIOS attributes, status: {response.status_code}')
-        return response.json().get('Attributes', {})
+        self._bios_attrs_cache = self.api.parse(response).get('Attributes', {})
+        return self._bios_attrs_cache
 
     def check_pxe_status(self, mac_address: str) -> dict:
         """Check whether PXE is enabled for a NIC identified by MAC address.
@@ -946,18 +1188,13 @@ class DellFish:
         # Check BIOS PxeDev slots
         bios_attrs = self._get_bios_attributes()
         bios_slot = None
-        for i in range(1, 5):
-            en_key = f'PxeDev{i}EnDis'
-            iface_key = f'PxeDev{i}Interface'
-            proto_key = f'PxeDev{i}Protocol'
-            if en_key not in bios_attrs:
-                continue
-            if bios_attrs.get(iface_key) == nic_id:
+        for i, (enabled, current_iface, proto) in _pxe_slots(bios_attrs).items():
+            if current_iface == nic_id:
                 bios_slot = {
                     'slot': i,
-                    'enabled': bios_attrs.get(en_key, 'Disabled') == 'Enabled',
-                    'interface': bios_attrs.get(iface_key, ''),
-                    'protocol': bios_attrs.get(proto_key, ''),
+                    'enabled': enabled == 'Enabled',
+                    'interface': current_iface,
+                    'protocol': proto,
                 }
                 break
 
@@ -993,17 +1230,7 @@ class DellFish:
 
         # Check PxeDev1 through PxeDev4 for an existing or free slot
         target_slot = None
-        for i in range(1, 5):
-            en_key = f'PxeDev{i}EnDis'
-            iface_key = f'PxeDev{i}Interface'
-
-            # Skip if the BIOS doesn't have these attributes at all
-            if en_key not in bios_attrs:
-                continue
-
-            current_iface = bios_attrs.get(iface_key, '')
-            enabled = bios_attrs.get(en_key, 'Disabled')
-
+        for i, (enabled, current_iface, _) in _pxe_slots(bios_attrs).items():
             # Already assigned to this NIC
             if current_iface == nic_id:
                 target_slot = i
@@ -1029,6 +1256,7 @@ class DellFish:
         settings_path = f'/redfish/v1/Systems/{self.system_id}/Bios/Settings'
         response = self.api.patch(settings_path, data=payload)
         if response.status_code in [200, 202, 204]:
+            self._bios_attrs_cache = None
             result = {
                 'nic_id': nic_id,
                 'mac_address': mac_address,
@@ -1050,11 +1278,4 @@ class DellFish:
 
             return result
         else:
-            detail = ''
-            try:
-                detail = json.dumps(response.json(), indent=2)
-            except Exception:
-                detail = response.text
-            raise ValueError(
-                f'Failed to enable PXE on {nic_id}, status: {response.status_code}, detail: {detail}'
-            )
+            raise RedfishError(f'Failed to enable PXE on {nic_id}', response)
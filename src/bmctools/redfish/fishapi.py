@@ -1,111 +1,470 @@
 import requests
+import bisect
+import functools
 import json
-from typing import Optional
+import os
+import ssl
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Separators stripped from MAC addresses before comparison (covers the
+# colon, hyphen and Cisco-style dotted forms)
+_MAC_STRIP = str.maketrans('', '', ':-. ')
+
+
+def _format_json(data) -> str:
+    """Pretty-print a JSON document with a two-space indent."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_mac(mac: str) -> str:
+    """Normalize a MAC address to uppercase hex without separators."""
+    # Fast paths for the common bare and colon-separated 48-bit forms
+    if len(mac) == 12 and mac.isalnum():
+        return mac.upper()
+    if len(mac) == 17 and mac[2] == ':' and mac[5] == ':':
+        return (mac[0:2] + mac[3:5] + mac[6:8] + mac[9:11] + mac[12:14] + mac[15:17]).upper()
+    return mac.translate(_MAC_STRIP).upper()
+
+
+class _MultipartStream:
+    """A multipart/form-data request body that reads file parts lazily.
+
+    ``requests`` encodes ``files=`` uploads into one in-memory ``bytes``
+    body, which for firmware images means buffering the whole file. This
+    file-like body knows its total length up front (so ``Content-Length``
+    is still sent) and reads file parts from disk as the socket consumes
+    them. It is seekable, so the same body can be rewound and sent again.
+
+    Attributes:
+        content_type: ``Content-Type`` header value, including the boundary.
+    """
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, fields: list) -> None:
+        """Lay out the body.
+
+        Args:
+            fields: ``(name, (filename, content, content_type))`` tuples, in
+                the same form as a ``files=`` list for ``requests``. Content
+                may be ``str``, ``bytes`` or a binary file object opened
+                on a regular file.
+        """
+        boundary = uuid.uuid4().hex
+        self.content_type = f'multipart/form-data; boundary={boundary}'
+        # Each segment is either bytes or a (file, start offset, size) slice
+        self._segments = []
+        for name, (filename, content, content_type) in fields:
+            self._segments.append((
+                f'--{boundary}\r\n'
+                f'Content-Disposition: form-data; name="{_quote_param(name)}"; '
+                f'filename="{_quote_param(filename)}"\r\n'
+                f'Content-Type: {content_type}\r\n\r\n'
+            ).encode())
+            if isinstance(content, str):
+                content = content.encode()
+            if isinstance(content, bytes):
+                self._segments.append(content)
+            else:
+                start = content.tell()
+                self._segments.append((content, start, os.fstat(content.fileno()).st_size - start))
+            self._segments.append(b'\r\n')
+        self._segments.append(f'--{boundary}--\r\n'.encode())
+
+        self._starts = []
+        length = 0
+        for segment in self._segments:
+            self._starts.append(length)
+            length += len(segment) if isinstance(segment, bytes) else segment[2]
+        self._length = length
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._pos
+        elif whence == os.SEEK_END:
+            offset += self._length
+        self._pos = min(max(offset, 0), self._length)
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._length - self._pos
+        chunks = []
+        while size > 0 and self._pos < self._length:
+            i = bisect.bisect_right(self._starts, self._pos) - 1
+            segment = self._segments[i]
+            offset = self._pos - self._starts[i]
+            if isinstance(segment, bytes):
+                chunk = segment[offset:offset + size]
+            else:
+                f, start, segment_size = segment
+                f.seek(start + offset)
+                chunk = f.read(min(size, segment_size - offset))
+                if not chunk:
+                    raise IOError(f'{getattr(f, "name", "file")} shrank during upload')
+            chunks.append(chunk)
+            self._pos += len(chunk)
+            size -= len(chunk)
+        return b''.join(chunks)
+
+
+def _quote_param(value: str) -> str:
+    """Escape a multipart header parameter value (HTML5 form encoding)."""
+    return value.replace('\\', '\\\\').replace('"', '%22').replace('\r', '%0D').replace('\n', '%0A')
+
+
+class _SSLContextAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools share one prebuilt SSLContext."""
+
+    def __init__(self, ssl_context: Optional[ssl.SSLContext] = None, **kwargs) -> None:
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        if self._ssl_context is not None:
+            kwargs['ssl_context'] = self._ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+
+class _RedfishRetry(Retry):
+    """Retry policy that resends a POST only when the BMC refused it outright.
+
+    POSTs (resets, job and session creation) are not idempotent, so unlike
+    the allowed methods they are only retried on a 429 or 503 carrying
+    ``Retry-After``, where the BMC has said it did not act on the request.
+    Connection errors are retried for every method, since nothing was sent.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method == 'POST':
+            return bool(self.total and self.respect_retry_after_header and has_retry_after
+                        and status_code in (429, 503))
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class RedfishError(ValueError):
+    """A Redfish request that the BMC rejected.
+
+    The error body is only pretty-printed when the exception is turned into
+    a string, so callers that catch and discard the error skip that work.
+
+    Attributes:
+        status_code: HTTP status code of the failed response.
+        response: The failed HTTP response object.
+    """
+    def __init__(self, message: str, response: requests.Response) -> None:
+        """Initialize the error.
+
+        Args:
+            message: Short description of the failed operation
+                (e.g., ``'Failed to set boot order'``).
+            response: The failed HTTP response object.
+        """
+        super().__init__(message)
+        self.message = message
+        self.response = response
+        self.status_code = response.status_code
+        self._str = None
+
+    def __str__(self) -> str:
+        if self._str is None:
+            try:
+                data = _json_loads(self.response.content)
+                error_detail = f"\nError details: {_format_json(data)}"
+            except Exception:
+                error_detail = f"\nResponse text: {getattr(self.response, 'text', '')}"
+            self._str = f'{self.message}, status code: {self.status_code}{error_detail}'
+        return self._str
+
 
 class RedfishAPI:
     """
     Redfish API client for interacting with the Redfish service.
     """
-    def __init__(self, ip: str, user: str, password: str, verify_ssl: bool = True) -> None:
-        """Initialize the Redfish API client and establish a session.
+    __slots__ = (
+        'ip', 'user', 'password', 'base_url', 'verify_ssl', 'session',
+        '_send', '_timeout', '_limiter', '_request_count', '_session_pending',
+        '_session_lock', '_upload_adapter', '_auth_token',
+    )
+
+    # Requests sent with basic auth before a Redfish session is opened
+    SESSION_AFTER_REQUESTS = 3
+
+    def __init__(self, ip: str, user: str, password: str, verify_ssl: bool = True,
+                 connect_timeout: Optional[float] = 5.0, read_timeout: Optional[float] = 60.0,
+                 eager_session: bool = False) -> None:
+        """Initialize the Redfish API client.
+
+        Short-lived clients get by on basic auth alone, so by default the
+        Redfish session is only created once the client has sent
+        :attr:`SESSION_AFTER_REQUESTS` requests.
 
         Args:
             ip: BMC IP address or hostname.
             user: BMC username.
             password: BMC password.
             verify_ssl: If True, verify SSL certificates (default: True).
+            connect_timeout: Seconds to wait for a connection to the BMC
+                (default: 5). None waits indefinitely.
+            read_timeout: Seconds to wait for the BMC to respond once
+                connected (default: 60). None waits indefinitely.
+            eager_session: If True, create the Redfish session immediately
+                instead of deferring it (default: False).
         """
         self.ip = ip
         self.user = user
         self.password = password
         self.base_url = f"https://{ip}"
+        self._timeout = (connect_timeout, read_timeout)
         self.session = requests.Session()
+        self.verify_ssl = verify_ssl
+        self._mount_adapter()
+        # Bound once; every verb method sends through it
+        self._send = self.session.request
+        # Cap concurrent requests to a single BMC
+        self._limiter = threading.BoundedSemaphore(8)
         self.session.auth = (user, password)
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json',
+            # Large Redfish documents (BIOS attributes, expanded collections)
+            # compress well; bodies are decoded from response.content bytes
+            'Accept-Encoding': 'gzip, deflate',
             'OData-Version': '4.0'
         })
-        self.verify_ssl = verify_ssl
 
         if not self.verify_ssl:
             self.disable_ssl_verification()
-        
-        # Try to establish a Redfish session
-        self._establish_session()
+
+        # Redfish session token, added to each request once a session is
+        # opened rather than written into the shared session headers
+        self._auth_token = None
+        self._request_count = 0
+        self._session_pending = True
+        self._session_lock = threading.Lock()
+        if eager_session:
+            self._start_session()
+
+
+    def _mount_adapter(self) -> None:
+        """Mount the pooled, retrying transport adapter on the session."""
+        # Keep connections to the BMC alive and pooled so each call does not
+        # pay for a fresh TCP + TLS handshake. BMCs throttle aggressively, so
+        # transient 429/5xx responses and dropped connections are retried with
+        # exponential backoff (honouring Retry-After); the final response is
+        # still returned for the caller to inspect. Only idempotent verbs are
+        # resent after a response or read error: a POST (resets, job and
+        # session creation) or PATCH may already have taken effect.
+        retry = _RedfishRetry(
+            total=5,
+            connect=3,
+            read=3,
+            status=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+            allowed_methods=frozenset(['GET', 'HEAD', 'PUT', 'DELETE']),
+            raise_on_status=False,
+        )
+        # Without verification, build the permissive SSLContext once and
+        # share it across the pool instead of per connection
+        ssl_context = None
+        if not self.verify_ssl:
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+        # One client only ever talks to one BMC, so a single host pool is
+        # enough; it holds at least as many connections as the request
+        # limiter allows in flight, so none are discarded and re-handshaken.
+        adapter = _SSLContextAdapter(
+            ssl_context=ssl_context, pool_connections=1, pool_maxsize=16, pool_block=False, max_retries=retry
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # File uploads are never resent: the body is large and the BMC may
+        # already be flashing it when an error comes back
+        self._upload_adapter = _SSLContextAdapter(
+            ssl_context=ssl_context, pool_connections=1, pool_maxsize=1, max_retries=0
+        )
 
 
     def disable_ssl_verification(self) -> None:
         """Disable SSL certificate verification and suppress InsecureRequestWarning."""
-        self.verify_ssl = False
+        if self.verify_ssl:
+            self.verify_ssl = False
+            # Rebuild the pool around an unverified SSLContext
+            self._mount_adapter()
         requests.packages.urllib3.disable_warnings(requests.packages.urllib3.exceptions.InsecureRequestWarning)
 
 
-    def get(self, endpoint: str, params: Optional[dict] = None) -> requests.Response:
+    def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Send a request to a Redfish endpoint through the shared session.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'PATCH').
+            endpoint: Redfish endpoint path.
+            **kwargs: Extra arguments passed to :meth:`requests.Session.request`.
+
+        Returns:
+            HTTP response object.
+        """
+        if self._session_pending:
+            self._count_request()
+        if self._auth_token is not None:
+            kwargs['headers'] = {'X-Auth-Token': self._auth_token, **(kwargs.get('headers') or {})}
+        with self._limiter:
+            return self._send(method, self.base_url + endpoint, verify=self.verify_ssl,
+                              timeout=self._timeout, **kwargs)
+
+
+    @staticmethod
+    def _body(data: Optional[Union[dict, str, bytes]]) -> dict:
+        """Pick the request keyword for a body.
+
+        Pre-encoded bodies are sent as ``data=``. Dicts are encoded to bytes
+        with orjson when it is installed, otherwise handed to requests as
+        ``json=``.
+        """
+        if isinstance(data, (str, bytes)):
+            return {'data': data}
+        if data is not None and orjson is not None:
+            return {'data': orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)}
+        return {'json': data}
+
+
+    def parse(self, response: requests.Response):
+        """Decode a JSON response body.
+
+        Uses orjson when it is installed, which is considerably faster than
+        :meth:`requests.Response.json` on large documents such as BIOS
+        attribute registries.
+
+        Args:
+            response: HTTP response with a JSON body.
+
+        Returns:
+            Decoded JSON document (usually a dict).
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        return _json_loads(response.content)
+
+
+    def get(self, endpoint: str, params: Optional[dict] = None, headers: Optional[dict] = None) -> requests.Response:
         """Send a GET request to a Redfish endpoint.
 
         Args:
             endpoint: Redfish endpoint path (e.g., '/redfish/v1/Systems').
             params: Optional query parameters.
+            headers: Optional additional headers (e.g., ``{'If-None-Match': etag}``).
 
         Returns:
             HTTP response object.
         """
-        url = self.base_url + endpoint
-        response = self.session.get(url, params=params, verify=self.verify_ssl)
-        return response
+        return self._request('GET', endpoint, params=params, headers=headers)
+
 
+    def get_many(self, paths: list, headers: Optional[dict] = None, skip_errors: bool = False) -> list:
+        """Send GET requests for several Redfish endpoints concurrently.
+
+        Args:
+            paths: Redfish endpoint paths.
+            headers: Optional mapping of path to additional headers for that
+                request (e.g., ``{path: {'If-None-Match': etag}}``).
+            skip_errors: If True, a request that fails at the transport level
+                is reported as ``None`` instead of raising.
 
-    def post(self, endpoint: str, data: Optional[dict] = None) -> requests.Response:
+        Returns:
+            List of HTTP response objects (or ``None``) in the same order as
+            *paths*.
+        """
+        if not paths:
+            return []
+        headers = headers or {}
+
+        def fetch(path: str) -> Optional[requests.Response]:
+            try:
+                return self.get(path, headers=headers.get(path))
+            except requests.exceptions.RequestException:
+                if not skip_errors:
+                    raise
+                return None
+
+        # The request limiter still caps how many are in flight at once
+        with ThreadPoolExecutor(max_workers=min(16, len(paths))) as executor:
+            return list(executor.map(fetch, paths))
+
+
+    def post(self, endpoint: str, data: Optional[Union[dict, str, bytes]] = None) -> requests.Response:
         """Send a POST request to a Redfish endpoint.
 
         Args:
             endpoint: Redfish endpoint path.
-            data: Optional request body as a dict (will be JSON-serialized).
+            data: Optional request body as a dict (will be JSON-serialized) or
+                already-encoded JSON ``str``/``bytes`` (sent as-is).
 
         Returns:
             HTTP response object.
         """
-        url = self.base_url + endpoint
-        if data:
-            data = json.dumps(data)
-        response = self.session.post(url, data=data, verify=self.verify_ssl)
-        return response
+        return self._request('POST', endpoint, **self._body(data))
 
 
-    def put(self, endpoint: str, data: Optional[dict] = None) -> requests.Response:
+    def put(self, endpoint: str, data: Optional[Union[dict, str, bytes]] = None) -> requests.Response:
         """Send a PUT request to a Redfish endpoint.
 
         Args:
             endpoint: Redfish endpoint path.
-            data: Optional request body as a dict (will be JSON-serialized).
+            data: Optional request body as a dict (will be JSON-serialized) or
+                already-encoded JSON ``str``/``bytes`` (sent as-is).
 
         Returns:
             HTTP response object.
         """
-        url = self.base_url + endpoint
-        if data:
-            data = json.dumps(data)
-        response = self.session.put(url, data=data, verify=self.verify_ssl)
-        return response
+        return self._request('PUT', endpoint, **self._body(data))
 
 
-    def patch(self, endpoint: str, data: Optional[dict] = None, headers: Optional[dict] = None) -> requests.Response:
+    def patch(self, endpoint: str, data: Optional[Union[dict, str, bytes]] = None, headers: Optional[dict] = None) -> requests.Response:
         """Send a PATCH request to a Redfish endpoint.
 
         Args:
             endpoint: Redfish endpoint path.
-            data: Optional request body as a dict (will be JSON-serialized).
+            data: Optional request body as a dict (will be JSON-serialized) or
+                already-encoded JSON ``str``/``bytes`` (sent as-is).
             headers: Optional additional headers (e.g., ``{'If-Match': etag}``).
 
         Returns:
             HTTP response object.
         """
-        url = self.base_url + endpoint
-        if data:
-            data = json.dumps(data)
-        response = self.session.patch(url, data=data, headers=headers, verify=self.verify_ssl)
-        return response
+        return self._request('PATCH', endpoint, headers=headers, **self._body(data))
 
 
     def delete(self, endpoint: str) -> requests.Response:
@@ -117,9 +476,7 @@ class RedfishAPI:
         Returns:
             HTTP response object.
         """
-        url = self.base_url + endpoint
-        response = self.session.delete(url, verify=self.verify_ssl)
-        return response
+        return self._request('DELETE', endpoint)
 
 
     def post_file(self, endpoint: str, file_path: str, additional_data: Optional[dict] = None, file_field_name: str = 'file') -> requests.Response:
@@ -136,23 +493,12 @@ class RedfishAPI:
         """
         url = self.base_url + endpoint
 
-        # Temporarily remove Content-Type header for multipart upload
-        original_content_type = self.session.headers.pop('Content-Type', None)
-
-        try:
-            with open(file_path, 'rb') as f:
-                files = {file_field_name: f}
-                data = additional_data or {}
-                response = self.session.post(
-                    url,
-                    files=files,
-                    data=data,
-                    verify=self.verify_ssl
-                )
-        finally:
-            # Restore Content-Type header
-            if original_content_type:
-                self.session.headers['Content-Type'] = original_content_type
+        with open(file_path, 'rb') as f:
+            files = {file_field_name: f}
+            data = additional_data or {}
+            # A None value drops the session's JSON Content-Type for this
+            # request only, so requests sets the multipart one
+            response = self._send_once('POST', url, files=files, data=data, headers={'Content-Type': None})
 
         return response
 
@@ -161,6 +507,7 @@ class RedfishAPI:
         """Upload firmware using Redfish multipart HTTP push format.
 
         All parts are sent as proper multipart file parts with correct content types.
+        The firmware image is streamed from disk rather than buffered in memory.
 
         Args:
             endpoint: The API endpoint
@@ -171,35 +518,62 @@ class RedfishAPI:
         Returns:
             Response object
         """
-        import os
         url = self.base_url + endpoint
         filename = os.path.basename(file_path)
 
-        # Temporarily remove Content-Type header for multipart upload
-        original_content_type = self.session.headers.pop('Content-Type', None)
+        with open(file_path, 'rb') as f:
+            # Build multipart parts with proper content types
+            files = [
+                ('UpdateParameters', ('UpdateParameters.json', json.dumps(update_params), 'application/json')),
+                ('UpdateFile', (filename, f, 'application/octet-stream')),
+            ]
+            if oem_params is not None:
+                files.insert(1, ('OemParameters', ('OemParameters.json', json.dumps(oem_params), 'application/json')))
 
-        try:
-            with open(file_path, 'rb') as f:
-                # Build multipart parts with proper content types
-                files = [
-                    ('UpdateParameters', ('UpdateParameters.json', json.dumps(update_params), 'application/json')),
-                    ('UpdateFile', (filename, f, 'application/octet-stream')),
-                ]
-                if oem_params is not None:
-                    files.insert(1, ('OemParameters', ('OemParameters.json', json.dumps(oem_params), 'application/json')))
-
-                response = self.session.post(
-                    url,
-                    files=files,
-                    verify=self.verify_ssl
-                )
-        finally:
-            if original_content_type:
-                self.session.headers['Content-Type'] = original_content_type
+            body = _MultipartStream(files)
+            response = self._send_once('POST', url, data=body, headers={'Content-Type': body.content_type})
 
         return response
 
 
+    def _send_once(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the session without any retries.
+
+        The request still picks up the session's headers, auth and proxy
+        settings, but bypasses the retrying adapter.
+
+        Args:
+            method: HTTP method.
+            url: Full request URL.
+            **kwargs: Arguments for :class:`requests.Request` (``data``,
+                ``files``, ``headers``, ...).
+
+        Returns:
+            HTTP response object.
+        """
+        if self._auth_token is not None:
+            kwargs['headers'] = {'X-Auth-Token': self._auth_token, **(kwargs.get('headers') or {})}
+        prepared = self.session.prepare_request(requests.Request(method, url, **kwargs))
+        settings = self.session.merge_environment_settings(url, {}, None, self.verify_ssl, None)
+        return self._upload_adapter.send(prepared, **settings)
+
+
+    def _count_request(self) -> None:
+        """Count a request and open the Redfish session once enough were sent."""
+        with self._session_lock:
+            if not self._session_pending:
+                return
+            self._request_count += 1
+            if self._request_count > self.SESSION_AFTER_REQUESTS:
+                self._start_session()
+
+
+    def _start_session(self) -> None:
+        """Try to establish a Redfish session, at most once per client."""
+        self._session_pending = False
+        self._establish_session()
+
+
     def _establish_session(self) -> None:
         """Attempt to create a Redfish session if supported."""
         try:
@@ -220,7 +594,9 @@ class RedfishAPI:
                 # Session created successfully
                 auth_token = response.headers.get('X-Auth-Token')
                 if auth_token:
-                    self.session.headers.update({'X-Auth-Token': auth_token})
+                    # Other threads may be sending through the session right
+                    # now, so its headers are left alone
+                    self._auth_token = auth_token
                     # Keep basic auth as fallback for endpoints that don't accept tokens
                     # Some BMCs (like Asus) require basic auth for file uploads
                     # self.session.auth = None  # Commented out to keep basic auth
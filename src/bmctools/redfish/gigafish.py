@@ -23,11 +23,11 @@ class GigaFish:
         """Get the system ID from the Systems collection."""
         response = self.api.get('/redfish/v1/Systems')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             members = data.get('Members', [])
             if members and len(members) > 0:
                 odata_id = members[0].get('@odata.id', '')
-                system_id = odata_id.split('/')[-1]
+                system_id = odata_id.rpartition('/')[2]
                 return system_id if system_id else '1'
         return '1'
 
@@ -71,7 +71,7 @@ class GigaFish:
         """
         response = self.api.get(self._system_uri())
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             boot_order = data.get('Boot', {}).get('BootOrder', [])
             if not boot_order:
                 raise ValueError("BootOrder not found in response")
@@ -97,13 +97,13 @@ class GigaFish:
 
         response = self.api.get(f'{self._system_uri()}/BootOptions')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             members = data.get('Members', [])
             boot_options = []
             for member in members:
                 option_response = self.api.get(member['@odata.id'])
                 if option_response.status_code == 200:
-                    boot_options.append(option_response.json())
+                    boot_options.append(self.api.parse(option_response))
 
             self.boot_options = boot_options
             return boot_options
@@ -231,7 +231,7 @@ class GigaFish:
         else:
             error_detail = ""
             try:
-                error_data = response.json()
+                error_data = self.api.parse(response)
                 error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
             except:
                 error_detail = f"\nResponse text: {response.text}"
@@ -251,7 +251,7 @@ class GigaFish:
         """
         response = self.api.get(self._system_uri())
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             actions = data.get('Actions', {})
 
             reset_action = (actions.get('#ComputerSystem.Reset') or
@@ -307,7 +307,7 @@ class GigaFish:
         else:
             error_detail = ""
             try:
-                error_data = response.json()
+                error_data = self.api.parse(response)
                 error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
             except:
                 error_detail = f"\nResponse text: {response.text}"
@@ -326,7 +326,7 @@ class GigaFish:
         """
         response = self.api.get('/redfish/v1/UpdateService/FirmwareInventory')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             members = data.get('Members', [])
 
             firmware_list = []
@@ -337,7 +337,7 @@ class GigaFish:
                 try:
                     fw_resp = self.api.get(member_url)
                     if fw_resp.status_code == 200:
-                        fw_data = fw_resp.json()
+                        fw_data = self.api.parse(fw_resp)
                         firmware_list.append({
                             'Id': fw_data.get('Id'),
                             'Name': fw_data.get('Name'),
@@ -369,13 +369,13 @@ class GigaFish:
         if response.status_code != 200:
             raise ValueError(f'Failed to retrieve EthernetInterfaces, status code: {response.status_code}')
 
-        data = response.json()
+        data = self.api.parse(response)
         members = data.get('Members', [])
         interfaces = []
         for member in members:
             iface_resp = self.api.get(member['@odata.id'])
             if iface_resp.status_code == 200:
-                interfaces.append(iface_resp.json())
+                interfaces.append(self.api.parse(iface_resp))
 
         return interfaces
 
@@ -390,11 +390,11 @@ class GigaFish:
         """
         response = self.api.get('/redfish/v1/Managers')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             members = data.get('Members', [])
             if members:
                 odata_id = members[0].get('@odata.id', '')
-                return odata_id.split('/')[-1] or '1'
+                return odata_id.rpartition('/')[2] or '1'
         return '1'
 
     def get_supported_bmc_reset_types(self) -> dict:
@@ -407,7 +407,7 @@ class GigaFish:
         manager_id = self._get_manager_id()
         response = self.api.get(f'/redfish/v1/Managers/{manager_id}')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             actions = data.get('Actions', {})
 
             reset_action = (actions.get('#Manager.Reset') or
@@ -437,7 +437,7 @@ class GigaFish:
         """Fetch allowable values from a Redfish ActionInfo endpoint."""
         response = self.api.get(action_info_uri)
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             for param in data.get('Parameters', []):
                 if param.get('Name') == 'ResetType':
                     return param.get('AllowableValues', [])
@@ -477,7 +477,7 @@ class GigaFish:
         else:
             error_detail = ""
             try:
-                error_data = response.json()
+                error_data = self.api.parse(response)
                 error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
             except:
                 error_detail = f"\nResponse text: {response.text}"
@@ -1,5 +1,142 @@
+import functools
+import importlib
+import json
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
-from bmctools.redfish.fishapi import RedfishAPI
+from bmctools.redfish.fishapi import RedfishAPI, RedfishError
+
+try:
+    import fcntl
+except ImportError:  # Windows: cache writes are not locked
+    fcntl = None
+
+# Manufacturer-specific classes keyed by normalized manufacturer name
+# (see _normalize_manufacturer), as (module path, class name)
+_MANUFACTURER_CLASSES = {
+    'supermicro': ('bmctools.redfish.smcfish', 'SMCFish'),
+    'asus': ('bmctools.redfish.asusfish', 'AsusFish'),
+    'asustekcomputerinc': ('bmctools.redfish.asusfish', 'AsusFish'),
+    'dell': ('bmctools.redfish.dellfish', 'DellFish'),
+    'dellinc': ('bmctools.redfish.dellfish', 'DellFish'),
+    'gigabyte': ('bmctools.redfish.gigafish', 'GigaFish'),
+    'gigacomputing': ('bmctools.redfish.gigafish', 'GigaFish'),
+    'cisco': ('bmctools.redfish.ciscofish', 'CiscoFish'),
+    'ciscosystemsinc': ('bmctools.redfish.ciscofish', 'CiscoFish'),
+}
+
+_MANUFACTURER_STRIP = str.maketrans('', '', ' .,')
+
+
+def _normalize_manufacturer(manufacturer: str) -> str:
+    """Lowercase a manufacturer name and drop spaces and punctuation.
+
+    e.g. ``'ASUSTeK COMPUTER INC.'`` -> ``'asustekcomputerinc'``.
+    """
+    return manufacturer.lower().translate(_MANUFACTURER_STRIP)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_manufacturer_class(normalized: str) -> Optional[type]:
+    """Import and return the class registered for a normalized manufacturer.
+
+    Args:
+        normalized: Output of :func:`_normalize_manufacturer`.
+
+    Returns:
+        The manufacturer-specific class, or ``None`` if none is registered.
+    """
+    entry = _MANUFACTURER_CLASSES.get(normalized)
+    if entry is None:
+        return None
+    module_path, class_name = entry
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+# System IDs used by most BMC vendors (Supermicro/HPE, Dell, ASUS/Gigabyte).
+# Probed during detection only when the Systems collection cannot be read.
+_COMMON_SYSTEM_IDS = ('1', 'System.Embedded.1', 'Self')
+
+# First member link in a raw Systems collection body
+_SYSTEM_MEMBER_RE = re.compile(rb'"@odata\.id"\s*:\s*"/redfish/v1/Systems/([^"/]+)"')
+
+# On-disk cache of each BMC's system ID and manufacturer, keyed by IP.
+# Both are fixed for the life of a server, so detection can be skipped.
+_META_CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'bmctools', 'bmc_meta.json'
+)
+_META_CACHE_TTL = 30 * 86400
+
+
+def _read_meta_cache() -> dict:
+    """Read the whole metadata cache, or an empty dict if unreadable."""
+    try:
+        with open(_META_CACHE_PATH, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _load_meta(ip: str) -> Optional[dict]:
+    """Look up cached metadata for a BMC.
+
+    Args:
+        ip: BMC IP address or hostname.
+
+    Returns:
+        Dict with ``system_id`` and ``manufacturer``, or ``None`` if the BMC
+        is not cached, its entry is older than 30 days, or the entry is
+        malformed.
+    """
+    entry = _read_meta_cache().get(ip)
+    if not isinstance(entry, dict):
+        return None
+    cached_at = entry.get('cached_at')
+    if type(cached_at) not in (int, float) or time.time() - cached_at > _META_CACHE_TTL:
+        return None
+    for key in ('system_id', 'manufacturer'):
+        if not isinstance(entry.get(key), str) or not entry[key]:
+            return None
+    return entry
+
+
+def _save_meta(ip: str, system_id: str, manufacturer: str) -> None:
+    """Record a BMC's metadata in the cache, ignoring write failures.
+
+    The file is rewritten atomically so concurrent readers never see a
+    partial document, and the read-modify-write is serialized across
+    processes with an exclusive lock on a sidecar ``.lock`` file so
+    concurrent writers don't drop each other's entries.
+
+    Args:
+        ip: BMC IP address or hostname.
+        system_id: Redfish system ID.
+        manufacturer: Lowercased manufacturer string.
+    """
+    cache_dir = os.path.dirname(_META_CACHE_PATH)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(_META_CACHE_PATH + '.lock', 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            data = _read_meta_cache()
+            data[ip] = {'system_id': system_id, 'manufacturer': manufacturer, 'cached_at': time.time()}
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.bmc_meta.')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, _META_CACHE_PATH)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+    except OSError:
+        pass
+
 
 class Redfish:
     """
@@ -8,7 +145,8 @@ class Redfish:
     This class initializes the RedfishAPI and determines the manufacturer-specific
     implementation to use based on the system's manufacturer.
     """
-    def __init__(self, ip: str, username: str, password: str, verify_ssl: bool = False, manufacturer: Optional[str] = None) -> None:
+    def __init__(self, ip: str, username: str, password: str, verify_ssl: bool = False, manufacturer: Optional[str] = None,
+                 nocache: bool = False) -> None:
         """Initialize the Redfish client and detect the manufacturer.
 
         Args:
@@ -17,36 +155,95 @@ class Redfish:
             password: Redfish password.
             verify_ssl: Whether to verify SSL certificates (default: False).
             manufacturer: Force a specific manufacturer string instead of
-                auto-detecting from the system resource.
+                auto-detecting from the system resource. The system ID is
+                then only looked up when first needed.
+            nocache: If True, ignore the on-disk metadata cache and detect
+                the system ID and manufacturer from the BMC, refreshing the
+                cached entry.
+
+        Detected system IDs and manufacturers are cached on disk per IP
+        (``~/.cache/bmctools/bmc_meta.json``) for 30 days, so later clients
+        for the same BMC skip detection entirely.
         """
         self.api = RedfishAPI(ip, username, password, verify_ssl=verify_ssl)
-        self.system_id = self.get_system_id()
-        self.manufacturer = manufacturer.lower() if manufacturer else self.get_manufacturer()
+        self._system_id = None
+        self._expanded_manufacturer = None
+        if manufacturer:
+            self.manufacturer = manufacturer.lower()
+        else:
+            meta = None if nocache else _load_meta(ip)
+            if meta:
+                self._system_id = meta['system_id']
+                self.manufacturer = meta['manufacturer']
+            else:
+                self.manufacturer = self._detect_manufacturer()
+                if self.manufacturer and self._system_id:
+                    _save_meta(ip, self._system_id, self.manufacturer)
         self.manufacturer_class = self.instantiate_manufacturer_class(self.manufacturer)
 
 
+    @property
+    def system_id(self) -> Optional[str]:
+        """System ID, resolved from the Systems collection on first use."""
+        if self._system_id is None:
+            self._system_id = self._probe_system_id()
+        return self._system_id
+
+
+    @system_id.setter
+    def system_id(self, value: Optional[str]) -> None:
+        self._system_id = value
+
+
+    def _probe_system_id(self) -> Optional[str]:
+        """Get the system ID without expanding or decoding the collection.
+
+        Used when the manufacturer is already known, so the inlined system
+        resource that :meth:`get_system_id` asks for is not needed. The ID
+        is read from the plain collection body with a regex; if that fails,
+        :meth:`get_system_id` is used instead.
+
+        Returns:
+            System ID string, or ``None`` if the collection cannot be read.
+        """
+        response = self.api.get('/redfish/v1/Systems')
+        if response.status_code == 200:
+            match = _SYSTEM_MEMBER_RE.search(response.content)
+            if match:
+                return match.group(1).decode()
+        return self.get_system_id()
+
+
     def get_system_id(self) -> Optional[str]:
         """Get the system ID from the Redfish Systems collection.
 
-        Queries ``/redfish/v1/Systems`` and extracts the ID segment from the
-        first member's ``@odata.id``.
+        Queries ``/redfish/v1/Systems?$expand=.($levels=1)`` and extracts the
+        ID segment from the first member's ``@odata.id``. When the BMC
+        honours ``$expand`` the member is inlined, and its ``Manufacturer``
+        is kept so :meth:`get_manufacturer` needs no request of its own.
+        BMCs that reject the query are asked for the plain collection.
 
         Returns:
             System ID string (e.g. ``'System.Embedded.1'``, ``'1'``), or
             ``None`` if the collection cannot be read.
         """
-        response = self.api.get('/redfish/v1/Systems')
+        response = self.api.get('/redfish/v1/Systems?$expand=.($levels=1)')
+        if response.status_code != 200:
+            response = self.api.get('/redfish/v1/Systems')
         if response.status_code == 200:
             try:
-                data = response.json()
+                data = self.api.parse(response)
                 members = data.get('Members', [])
                 if members and len(members) > 0:
+                    manufacturer = members[0].get('Manufacturer')
+                    if manufacturer:
+                        self._expanded_manufacturer = manufacturer.lower()
                     # Extract the system ID from the first member's @odata.id
                     # e.g., "/redfish/v1/Systems/System.Embedded.1" -> "System.Embedded.1"
                     odata_id = members[0].get('@odata.id', '')
-                    system_id = odata_id.split('/')[-1]
-                    return system_id
-            except Exception:
+                    return odata_id.rpartition('/')[2] or None
+            except (ValueError, AttributeError, TypeError):
+                # Not JSON, or not shaped like a Systems collection
                 pass
         return None
 
@@ -54,7 +251,9 @@ class Redfish:
     def get_manufacturer(self) -> Optional[str]:
         """Detect the server manufacturer from the Redfish system resource.
 
-        Reads ``/redfish/v1/Systems/{system_id}`` and returns the lowercased
+        Returns the value inlined in the expanded Systems collection when
+        :meth:`get_system_id` saw one; otherwise reads
+        ``/redfish/v1/Systems/{system_id}`` and returns the lowercased
         ``Manufacturer`` field.
 
         Returns:
@@ -63,46 +262,113 @@ class Redfish:
         """
         if not self.system_id:
             return None
-        
+        if self._expanded_manufacturer:
+            return self._expanded_manufacturer
+
         response = self.api.get(f'/redfish/v1/Systems/{self.system_id}')
+        return self._parse_manufacturer(response)
+
+
+    def _parse_manufacturer(self, response) -> Optional[str]:
+        """Read the lowercased ``Manufacturer`` from a system resource response."""
         if response.status_code == 200:
             try:
-                data = response.json()
+                data = self.api.parse(response)
                 manufacturer = data.get('Manufacturer')
                 return manufacturer.lower() if manufacturer else None
-            except Exception:
+            except (ValueError, AttributeError, TypeError):
+                # Not JSON, or not shaped like a system resource
                 pass
         return None
 
 
+    def _detect_manufacturer(self) -> Optional[str]:
+        """Resolve the system ID and manufacturer.
+
+        The expanded Systems collection usually yields both in one request;
+        otherwise the system resource is read for the manufacturer. Only if
+        the collection is unreadable or empty are the common system paths
+        probed.
+
+        Returns:
+            Lowercased manufacturer string, or ``None`` if unknown or unreachable.
+        """
+        self._system_id = self.get_system_id()
+        if self._system_id:
+            return self.get_manufacturer()
+        return self._probe_common_systems()
+
+
+    def _probe_common_systems(self) -> Optional[str]:
+        """Find the system among the common system IDs.
+
+        The candidates are fetched concurrently and the first one that
+        reports a manufacturer wins; its ID becomes the system ID.
+
+        Returns:
+            Lowercased manufacturer string, or ``None`` if no candidate matched.
+        """
+        executor = ThreadPoolExecutor(max_workers=len(_COMMON_SYSTEM_IDS))
+        try:
+            probes = {
+                executor.submit(self.api.get, f'/redfish/v1/Systems/{candidate}'): candidate
+                for candidate in _COMMON_SYSTEM_IDS
+            }
+            for probe in as_completed(probes):
+                if probe.exception() is not None:
+                    continue
+                manufacturer = self._parse_manufacturer(probe.result())
+                if manufacturer:
+                    self._system_id = probes[probe]
+                    return manufacturer
+        finally:
+            # Don't wait on slower candidates once one has answered
+            executor.shutdown(wait=False)
+        return None
+
+
     def instantiate_manufacturer_class(self, manufacturer: str) -> Optional[object]:
         """Instantiate the manufacturer-specific Redfish class.
 
         Args:
-            manufacturer: Lowercased manufacturer string (e.g., 'supermicro', 'dell').
+            manufacturer: Manufacturer name as reported by the BMC or given as
+                a hint (e.g., 'supermicro', 'dell inc.'). Case, spaces and
+                punctuation are ignored.
 
         Returns:
             Manufacturer-specific instance (SMCFish, DellFish, etc.), or None if unknown.
         """
-        if manufacturer == 'supermicro':
-            from bmctools.redfish.smcfish import SMCFish
-            return SMCFish(self.api)
-        if manufacturer in ['asus', 'asustekcomputerinc.', 'asustek computer inc.']:
-            from bmctools.redfish.asusfish import AsusFish
-            return AsusFish(self.api)
-        if manufacturer in ['dell', 'dell inc.']:
-            from bmctools.redfish.dellfish import DellFish
-            return DellFish(self.api)
-        if manufacturer in ['gigabyte', 'giga computing']:
-            from bmctools.redfish.gigafish import GigaFish
-            return GigaFish(self.api)
-        if manufacturer in ['cisco', 'cisco systems inc', 'cisco systems inc.']:
-            from bmctools.redfish.ciscofish import CiscoFish
-            return CiscoFish(self.api)
-        else:
+        if not manufacturer:
             return None
-        
-    
+        cls = _resolve_manufacturer_class(_normalize_manufacturer(manufacturer))
+        return cls(self.api) if cls else None
+
+
+    def _call(self, method_name: str, description: str, *args, **kwargs):
+        """Forward a call to the manufacturer-specific class.
+
+        Args:
+            method_name: Name of the method on the manufacturer class.
+            description: Operation name used in the error message
+                (e.g., ``'Boot order retrieval'``).
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            Whatever the manufacturer method returns.
+
+        Raises:
+            NotImplementedError: If there is no manufacturer class, or it
+                does not implement *method_name*.
+        """
+        if not self.manufacturer_class:
+            raise NotImplementedError(f'No manufacturer-specific implementation available for: {self.manufacturer}')
+        method = getattr(self.manufacturer_class, method_name, None)
+        if method is None:
+            raise NotImplementedError(f'{description} not implemented for manufacturer: {self.manufacturer}')
+        return method(*args, **kwargs)
+
+
     def get_boot_order(self) -> list:
         """Get the current boot order for the system.
 
@@ -112,13 +378,7 @@ class Redfish:
         Raises:
             NotImplementedError: If not supported for the detected manufacturer.
         """
-        if not self.manufacturer_class:
-            raise NotImplementedError(f'No manufacturer-specific implementation available for: {self.manufacturer}')
-        
-        try:
-            return self.manufacturer_class.get_boot_order()
-        except AttributeError:
-            raise NotImplementedError(f'Boot order retrieval not implemented for manufacturer: {self.manufacturer}')
+        return self._call('get_boot_order', 'Boot order retrieval')
         
     
     def get_boot_options(self, nocache: bool = False) -> list:
@@ -133,13 +393,7 @@ class Redfish:
         Raises:
             NotImplementedError: If not supported for the detected manufacturer.
         """
-        if not self.manufacturer_class:
-            raise NotImplementedError(f'No manufacturer-specific implementation available for: {self.manufacturer}')
-        
-        try:
-            return self.manufacturer_class.get_boot_options(nocache=nocache)
-        except AttributeError:
-            raise NotImplementedError(f'Boot options retrieval not implemented for manufacturer: {self.manufacturer}')
+        return self._call('get_boot_options', 'Boot options retrieval', nocache=nocache)
         
 
     def get_boot_option_by_mac(self, mac_address: str, type: Optional[str] = None, nocache: bool = False) -> dict:
@@ -157,13 +411,7 @@ class Redfish:
             NotImplementedError: If not supported for the detected manufacturer.
             ValueError: If no matching boot option is found.
         """
-        if not self.manufacturer_class:
-            raise NotImplementedError(f'No manufacturer-specific implementation available for: {self.manufacturer}')
-        
-        try:
-            return self.manufacturer_class.get_boot_option_by_mac(mac_address, type=type, nocache=nocache)
-        except AttributeError:
-            raise NotImplementedError(f'Boot option by MAC retrieval not implemented for manufacturer: {self.manufacturer}')
+        return self._call('get_boot_option_by_mac', 'Boot option by MAC retrieval', mac_address, type=type, nocache=nocache)
         
 
     def get_boot_option_by_alias(self, alias: str, nocache: bool = False) -> dict:
@@ -180,13 +428,7 @@ class Redfish:
             NotImplementedError: If not supported for the detected manufacturer.
             ValueError: If no matching boot option is found.
         """
-        if not self.manufacturer_class:
-            raise NotImplementedError(f'No manufacturer-specific implementation available for: {self.manufacturer}')
-        
-        try:
-            return self.manufacturer_class.get_boot_option_by_alias(alias, nocache=nocache)
-        except AttributeError:
-            raise NotImplementedError(f'Boot option by alias retrieval not implemented for manufacturer: {self.manufacturer}')
+        return self._call('get_boot_option_by_alias', 'Boot option by alias retrieval', alias, nocache=nocache)
         
     
     def set_boot_first_by_mac(self, mac_address: str, boot_type: str = None) -> dict:
@@ -203,13 +445,7 @@ class Redfish:
             NotImplementedError: If not supported for the detected manufacturer.
             ValueError: If no matching boot option is found.
         """
-        if not self.manufacturer_class:
-            raise NotImplementedError(f'No manufacturer-specific implementation available for: {self.manufacturer}')
-
-        try:
-            return self.manufacturer_class.set_boot_first_by_mac(mac_address, boot_type=boot_type)
-        except AttributeError:
-            raise NotImplementedError(f'set_boot_first_by_mac not implemented for manufacturer: {self.manufacturer}')
+        return self._call('set_boot_first_by_mac', 'set_boot_first_by_mac', mac_address, boot_type=boot_type)
 
 
     def set_boot_order(self, boot_order: list) -> dict:
@@ -227,13 +463,7 @@ class Redfish:
             NotImplementedError: If not supported for the detected manufacturer.
             ValueError: If the provided list is invalid.
         """
-        if not self.manufacturer_class:
-            raise NotImplementedError(f'No manufacturer-specific implementation available for: {self.manufacturer}')
-
-        try:
-            return self.manufacturer_class.set_boot_order(boot_order)
-        except AttributeError:
-            raise NotImplementedError(f'Setting boot order not implemented for manufacturer: {self.manufacturer}')
+        return self._call('set_boot_order', 'Setting boot order', boot_order)
 
 
     def reset_system(self, reset_type: str = None) -> bool:
@@ -249,13 +479,7 @@ class Redfish:
         Raises:
             NotImplementedError: If not implemented for the manufacturer
         """
-        if not self.manufacturer_class:
-            raise NotImplementedError(f'No manufacturer-specific implementation available for: {self.manufacturer}')
-
-        try:
-            return self.manufacturer_class.reset_system(reset_type)
-        except AttributeError:
-            raise NotImplementedError(f'System reset not implemented for manufacturer: {self.manufacturer}')
+        return self._call('reset_system', 'System reset', reset_type)
 
 
     def get_supported_reset_types(self) -> dict:
@@ -267,13 +491,7 @@ class Redfish:
         Raises:
             NotImplementedError: If not implemented for the manufacturer
         """
-        if not self.manufacturer_class:
-            raise NotImplementedError(f'No manufacturer-specific implementation available for: {self.manufacturer}')
-
-        try:
-            return self.manufacturer_class.get_supported_reset_types()
-        except AttributeError:
-            raise NotImplementedError(f'Reset types not implemented for manufacturer: {self.manufacturer}')
+        return self._call('get_supported_reset_types', 'Reset types')
 
 
     def reset_bmc(self, reset_type: str = None) -> bool:
@@ -289,13 +507,7 @@ class Redfish:
         Raises:
             NotImplementedError: If not implemented for the manufacturer
         """
-        if not self.manufacturer_class:
-            raise NotImplementedError(f'No manufacturer-specific implementation available for: {self.manufacturer}')
-
-        try:
-            return self.manufacturer_class.reset_bmc(reset_type)
-        except AttributeError:
-            raise NotImplementedError(f'BMC reset not implemented for manufacturer: {self.manufacturer}')
+        return self._call('reset_bmc', 'BMC reset', reset_type)
 
 
     def get_supported_bmc_reset_types(self) -> dict:
@@ -307,13 +519,7 @@ class Redfish:
         Raises:
             NotImplementedError: If not implemented for the manufacturer
         """
-        if not self.manufacturer_class:
-            raise NotImplementedError(f'No manufacturer-specific implementation available for: {self.manufacturer}')
-
-        try:
-            return self.manufacturer_class.get_supported_bmc_reset_types()
-        except AttributeError:
-            raise NotImplementedError(f'BMC reset types not implemented for manufacturer: {self.manufacturer}')
+        return self._call('get_supported_bmc_reset_types', 'BMC reset types')
 
 
     def get_firmware_inventory(self) -> dict:
@@ -325,13 +531,7 @@ class Redfish:
         Raises:
             NotImplementedError: If not implemented for the manufacturer
         """
-        if not self.manufacturer_class:
-            raise NotImplementedError(f'No manufacturer-specific implementation available for: {self.manufacturer}')
-
-        try:
-            return self.manufacturer_class.get_firmware_inventory()
-        except AttributeError:
-            raise NotImplementedError(f'Firmware inventory not implemented for manufacturer: {self.manufacturer}')
+        return self._call('get_firmware_inventory', 'Firmware inventory')
 
 
     def get_update_service_info(self) -> dict:
@@ -343,13 +543,7 @@ class Redfish:
         Raises:
             NotImplementedError: If not implemented for the manufacturer
         """
-        if not self.manufacturer_class:
-            raise NotImplementedError(f'No manufacturer-specific implementation available for: {self.manufacturer}')
-
-        try:
-            return self.manufacturer_class.get_update_service_info()
-        except AttributeError:
-            raise NotImplementedError(f'Update service info not implemented for manufacturer: {self.manufacturer}')
+        return self._call('get_update_service_info', 'Update service info')
 
 
     def update_bmc_firmware(self, firmware_path: str, preserve_config: bool = True) -> dict:
@@ -365,13 +559,7 @@ class Redfish:
         Raises:
             NotImplementedError: If not implemented for the manufacturer
         """
-        if not self.manufacturer_class:
-            raise NotImplementedError(f'No manufacturer-specific implementation available for: {self.manufacturer}')
-
-        try:
-            return self.manufacturer_class.update_bmc_firmware(firmware_path, preserve_config=preserve_config)
-        except AttributeError:
-            raise NotImplementedError(f'BMC firmware update not implemented for manufacturer: {self.manufacturer}')
+        return self._call('update_bmc_firmware', 'BMC firmware update', firmware_path, preserve_config=preserve_config)
 
 
     def get_network_interfaces(self) -> list:
@@ -383,13 +571,7 @@ class Redfish:
         Raises:
             NotImplementedError: If not implemented for the manufacturer
         """
-        if not self.manufacturer_class:
-            raise NotImplementedError(f'No manufacturer-specific implementation available for: {self.manufacturer}')
-
-        try:
-            return self.manufacturer_class.get_network_interfaces()
-        except AttributeError:
-            raise NotImplementedError(f'get_network_interfaces not implemented for manufacturer: {self.manufacturer}')
+        return self._call('get_network_interfaces', 'get_network_interfaces')
 
 
     # ── Boot Source Override (standard Redfish, all manufacturers) ────
@@ -403,12 +585,13 @@ class Redfish:
             Dict with current override target, enabled state, and allowable values.
         """
         # Delegate to manufacturer class if it has a custom implementation
-        if self.manufacturer_class and hasattr(self.manufacturer_class, 'get_boot_override'):
-            return self.manufacturer_class.get_boot_override()
+        override = getattr(self.manufacturer_class, 'get_boot_override', None)
+        if override is not None:
+            return override()
 
         response = self.api.get(f'/redfish/v1/Systems/{self.system_id}')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             boot = data.get('Boot', {})
             return {
                 'override_target': boot.get('BootSourceOverrideTarget', 'None'),
@@ -432,8 +615,9 @@ class Redfish:
         Returns:
             True if successful.
         """
-        if self.manufacturer_class and hasattr(self.manufacturer_class, 'set_boot_override'):
-            return self.manufacturer_class.set_boot_override(target, enabled)
+        override = getattr(self.manufacturer_class, 'set_boot_override', None)
+        if override is not None:
+            return override(target, enabled)
 
         payload = {
             "Boot": {
@@ -445,15 +629,7 @@ class Redfish:
         response = self.api.patch(f'/redfish/v1/Systems/{self.system_id}', data=payload)
         if response.status_code in [200, 204]:
             return True
-        else:
-            error_detail = ""
-            try:
-                import json
-                error_data = response.json()
-                error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
-            except:
-                error_detail = f"\nResponse text: {response.text}"
-            raise ValueError(f'Failed to set boot override, status code: {response.status_code}{error_detail}')
+        raise RedfishError('Failed to set boot override', response)
 
 
     # ── BIOS Settings (standard Redfish, all manufacturers) ───────────
@@ -464,12 +640,13 @@ class Redfish:
         Returns:
             Dict with BIOS attributes, id, and description.
         """
-        if self.manufacturer_class and hasattr(self.manufacturer_class, 'get_bios_settings'):
-            return self.manufacturer_class.get_bios_settings()
+        override = getattr(self.manufacturer_class, 'get_bios_settings', None)
+        if override is not None:
+            return override()
 
         response = self.api.get(f'/redfish/v1/Systems/{self.system_id}/Bios')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             return {
                 'attributes': data.get('Attributes', {}),
                 'id': data.get('Id'),
@@ -487,8 +664,9 @@ class Redfish:
         Returns:
             Dict of boot-related BIOS attributes.
         """
-        if self.manufacturer_class and hasattr(self.manufacturer_class, 'get_boot_bios_settings'):
-            return self.manufacturer_class.get_boot_bios_settings()
+        override = getattr(self.manufacturer_class, 'get_boot_bios_settings', None)
+        if override is not None:
+            return override()
 
         bios = self.get_bios_settings()
         attributes = bios.get('attributes', {})
@@ -513,10 +691,10 @@ class Redfish:
         Returns:
             True if the settings were accepted.
         """
-        if self.manufacturer_class and hasattr(self.manufacturer_class, 'set_bios_settings'):
-            return self.manufacturer_class.set_bios_settings(attributes)
+        override = getattr(self.manufacturer_class, 'set_bios_settings', None)
+        if override is not None:
+            return override(attributes)
 
-        import json
         settings_uri = f'/redfish/v1/Systems/{self.system_id}/Bios/Settings'
 
         payload = {
@@ -526,14 +704,7 @@ class Redfish:
         response = self.api.patch(settings_uri, data=payload)
         if response.status_code in [200, 202, 204]:
             return True
-        else:
-            error_detail = ""
-            try:
-                error_data = response.json()
-                error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
-            except:
-                error_detail = f"\nResponse text: {response.text}"
-            raise ValueError(f'Failed to set BIOS settings, status code: {response.status_code}{error_detail}')
+        raise RedfishError('Failed to set BIOS settings', response)
 
 
     def update_bios_firmware(self, firmware_path: str) -> dict:
@@ -548,10 +719,4 @@ class Redfish:
         Raises:
             NotImplementedError: If not implemented for the manufacturer
         """
-        if not self.manufacturer_class:
-            raise NotImplementedError(f'No manufacturer-specific implementation available for: {self.manufacturer}')
-
-        try:
-            return self.manufacturer_class.update_bios_firmware(firmware_path)
-        except AttributeError:
-            raise NotImplementedError(f'BIOS firmware update not implemented for manufacturer: {self.manufacturer}')
+        return self._call('update_bios_firmware', 'BIOS firmware update', firmware_path)
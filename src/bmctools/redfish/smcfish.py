@@ -1,40 +1,131 @@
+import re
+import time
+from typing import Optional
+from bmctools.redfish.fishapi import RedfishAPI, RedfishError, _normalize_mac
 
-from bmctools.redfish.fishapi import RedfishAPI
+# MAC address inside a UEFI device path, e.g. ".../MAC(3CECEF123456,0x1)/IPv4(...)"
+_UEFI_MAC_RE = re.compile(r'/MAC\(([0-9A-Fa-f]{12}),')
 
 class SMCFish:
     """
     Supermicro Redfish implementation.
     """
-    def __init__(self, fishapi: 'RedfishAPI') -> None:
+    def __init__(self, fishapi: RedfishAPI) -> None:
         """Initialize with a shared RedfishAPI session.
 
         Args:
             fishapi: An authenticated :class:`~bmctools.redfish.fishapi.RedfishAPI` instance.
         """
-        self.api = fishapi
-        self.boot_options = None
+        self.api: RedfishAPI = fishapi
+        self.boot_options: Optional[list] = None
+        self._expand_supported: Optional[bool] = None
+        self._boot_order: Optional[list] = None
+        self._boot_order_exp = 0.0
+        self._etag = None
+        self._by_mac = {}
+        self._by_alias = {}
+        self._alias_search = []
 
     
-    def get_boot_order(self) -> list:
+    def get_boot_order(self, nocache: bool = False, ttl: float = 30.0) -> list:
         """Get the current boot order from the Supermicro system.
 
+        The order is kept for *ttl* seconds and dropped by any successful
+        change made through this object.
+
+        Args:
+            nocache: If True, bypass the cache and query the BMC directly.
+            ttl: Seconds a fetched boot order stays valid.
+
         Returns:
             List of boot option references in order.
 
         Raises:
             ValueError: If the boot order cannot be retrieved.
         """
+        if not nocache and self._boot_order is not None and time.monotonic() < self._boot_order_exp:
+            return list(self._boot_order)
+
         response = self.api.get('/redfish/v1/Systems/1')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             boot_order = data.get('Boot', {}).get('BootOrder', [])
             if not boot_order:
                 raise ValueError("BootOrder not found in response")
+            self._etag = response.headers.get('ETag')
+            self._boot_order = list(boot_order)
+            self._boot_order_exp = time.monotonic() + ttl
             return boot_order
         else:
             raise ValueError(f'Failed to retrieve boot order, status code: {response.status_code}')
-        
-    
+
+
+    def set_boot_order(self, boot_order: list) -> dict:
+        """Set the boot order for the Supermicro system.
+
+        The new order is PATCHed to the System resource and takes effect on
+        the next reboot. The current order is read fresh first, and its ETag
+        is sent as ``If-Match``, which newer Supermicro firmware requires.
+
+        Args:
+            boot_order: List of boot option references (e.g., ["Boot0003", "Boot0001", ...]).
+                        Must include ALL boot options, not just a subset.
+
+        Returns:
+            Dict with keys: changed, needs_reboot, previous_boot_order, boot_order.
+
+        Raises:
+            ValueError: If the boot order doesn't include all required boot options or update fails.
+        """
+        # Read fresh so the order compared and the If-Match ETag are current
+        current_boot_order = self.get_boot_order(nocache=True)
+
+        current_set = frozenset(current_boot_order)
+        if len(boot_order) != len(current_boot_order) or current_set.symmetric_difference(boot_order):
+            new_set = frozenset(boot_order)
+            missing = current_set - new_set
+            extra = new_set - current_set
+            error_msg = f'Boot order must contain all {len(current_boot_order)} boot options exactly once.'
+            if missing:
+                error_msg += f' Missing options: {sorted(missing)}.'
+            if extra:
+                error_msg += f' Unknown options: {sorted(extra)}.'
+            raise ValueError(error_msg)
+
+        if boot_order == current_boot_order:
+            return {
+                'changed': False,
+                'needs_reboot': False,
+                'previous_boot_order': current_boot_order,
+                'boot_order': boot_order,
+            }
+
+        payload = {"Boot": {"BootOrder": boot_order}}
+        headers = {'If-Match': self._etag} if self._etag else None
+        response = self.api.patch('/redfish/v1/Systems/1', data=payload, headers=headers)
+        if response.status_code in [200, 202, 204]:
+            self._invalidate()
+            return {
+                'changed': True,
+                'needs_reboot': True,
+                'previous_boot_order': current_boot_order,
+                'boot_order': boot_order,
+            }
+        else:
+            raise RedfishError('Failed to set boot order', response)
+
+
+    def _invalidate(self) -> None:
+        """Drop cached boot state after a change on the BMC."""
+        self.boot_options = None
+        self._boot_order = None
+        self._boot_order_exp = 0.0
+        self._etag = None
+        self._by_mac = {}
+        self._by_alias = {}
+        self._alias_search = []
+
+
     # ── BMC (Manager) Reset ──────────────────────────────────────────
 
     def _get_manager_id(self) -> str:
@@ -45,11 +136,11 @@ class SMCFish:
         """
         response = self.api.get('/redfish/v1/Managers')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             members = data.get('Members', [])
             if members:
                 odata_id = members[0].get('@odata.id', '')
-                return odata_id.split('/')[-1] or '1'
+                return odata_id.rpartition('/')[2] or '1'
         return '1'
 
     def get_supported_bmc_reset_types(self) -> dict:
@@ -62,7 +153,7 @@ class SMCFish:
         manager_id = self._get_manager_id()
         response = self.api.get(f'/redfish/v1/Managers/{manager_id}')
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             actions = data.get('Actions', {})
 
             reset_action = (actions.get('#Manager.Reset') or
@@ -92,7 +183,7 @@ class SMCFish:
         """Fetch allowable values from a Redfish ActionInfo endpoint."""
         response = self.api.get(action_info_uri)
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             for param in data.get('Parameters', []):
                 if param.get('Name') == 'ResetType':
                     return param.get('AllowableValues', [])
@@ -130,18 +221,18 @@ class SMCFish:
         if response.status_code in [200, 202, 204]:
             return True
         else:
-            error_detail = ""
-            try:
-                error_data = response.json()
-                error_detail = f"\nError details: {json.dumps(error_data, indent=2)}"
-            except:
-                error_detail = f"\nResponse text: {response.text}"
-            raise ValueError(f'Failed to reset BMC, status code: {response.status_code}{error_detail}')
+            raise RedfishError('Failed to reset BMC', response)
 
 
     def get_boot_options(self, nocache: bool = False) -> list:
         """Get all available boot options.
 
+        The collection is requested with ``$expand=.($levels=1)`` so every
+        option arrives in one response. If the BMC rejects the query or
+        returns bare links, options are fetched one by one and ``$expand``
+        is not tried again for the life of this instance. Other errors only
+        fall back for the current call.
+
         Args:
             nocache: If True, bypass the cache and query the BMC directly.
 
@@ -155,19 +246,117 @@ class SMCFish:
         if not nocache and self.boot_options is not None:
             return self.boot_options
 
-        response = self.api.get('/redfish/v1/Systems/1/BootOptions')
+        path = '/redfish/v1/Systems/1/BootOptions'
+        response = None
+        expanded = False
+        # Ask for all members inline; fall back for good only if the BMC
+        # rejects the query itself, not on a transient error
+        if self._expand_supported is not False:
+            response = self.api.get(f'{path}?$expand=.($levels=1)')
+            if response.status_code == 200:
+                expanded = True
+            elif response.status_code in (400, 405, 501):
+                self._expand_supported = False
+        if not expanded:
+            response = self.api.get(path)
         if response.status_code == 200:
-            data = response.json()
+            data = self.api.parse(response)
             members = data.get('Members', [])
-            boot_options = []
-            for member in members:
-                option_response = self.api.get(member['@odata.id'])
-                if option_response.status_code == 200:
-                    option_data = option_response.json()
-                    boot_options.append(option_data)
+            # Older firmware accepts $expand but still returns bare links
+            if members and 'BootOptionReference' not in members[0]:
+                if expanded:
+                    self._expand_supported = False
+                boot_options = []
+                # Fetch every option concurrently over the shared session
+                for option_response in self.api.get_many([member['@odata.id'] for member in members]):
+                    if option_response.status_code == 200:
+                        option_data = self.api.parse(option_response)
+                        boot_options.append(option_data)
+            else:
+                if members and expanded:
+                    self._expand_supported = True
+                boot_options = members
 
             # Cache the boot options
             self.boot_options = boot_options
+            self._index_boot_options(boot_options)
             return boot_options
         else:
-            raise ValueError(f'Failed to retrieve boot options, status code: {response.status_code}')
\ No newline at end of file
+            raise ValueError(f'Failed to retrieve boot options, status code: {response.status_code}')
+
+
+    def _index_boot_options(self, boot_options: list) -> None:
+        """Build the MAC and alias lookups for a freshly fetched boot option list.
+
+        ``_by_mac`` maps an uppercase, separator-free MAC taken from the UEFI
+        device path to its options, ``_by_alias`` maps a lowercased Alias,
+        DisplayName or Name to its option, and ``_alias_search`` pairs each
+        option with those fields and its Description joined by NUL for
+        substring matching.
+        """
+        self._by_mac = {}
+        self._by_alias = {}
+        self._alias_search = []
+        for option in boot_options:
+            match = _UEFI_MAC_RE.search(option.get('UefiDevicePath') or '')
+            if match:
+                self._by_mac.setdefault(match.group(1).upper(), []).append(option)
+            names = [(option.get(field) or '').lower() for field in ('Alias', 'DisplayName', 'Name', 'Description')]
+            for key in names[:3]:
+                if key:
+                    self._by_alias.setdefault(key, option)
+            self._alias_search.append(('\0'.join(names), option))
+
+
+    def get_boot_option_by_mac(self, mac_address: str, type: Optional[str] = None, nocache: bool = False) -> dict:
+        """Get a boot option by MAC address.
+
+        Args:
+            mac_address: MAC address to search for (format: XX:XX:XX:XX:XX:XX or XXXXXXXXXXXX)
+            type: Optional boot option type to filter by (e.g., 'PXE')
+            nocache: If True, force a fresh API call instead of using cached boot options
+
+        Returns:
+            Dict containing the boot option data
+
+        Raises:
+            ValueError: If no boot option is found with the specified MAC address or type
+        """
+        self.get_boot_options(nocache=nocache)
+        normalized_mac = _normalize_mac(mac_address)
+
+        for option in self._by_mac.get(normalized_mac, ()):
+            # Check type if specified
+            if type and option.get('BootOptionType') is not None and option.get('BootOptionType', '').lower() != type.lower():
+                continue
+            return option
+
+        raise ValueError(f'No boot option found with MAC address: {mac_address}' + (f' and type: {type}' if type else ''))
+
+
+    def get_boot_option_by_alias(self, alias: str, nocache: bool = False) -> dict:
+        """Get a boot option by its alias or display name.
+
+        Args:
+            alias: The alias or display name to search for (case-insensitive)
+            nocache: If True, force a fresh API call instead of using cached boot options
+
+        Returns:
+            Dict containing the boot option data
+
+        Raises:
+            ValueError: If no boot option is found with the specified alias
+        """
+        self.get_boot_options(nocache=nocache)
+        alias_lower = alias.lower()
+
+        # An exact Alias/DisplayName/Name match takes precedence over substring matches
+        option = self._by_alias.get(alias_lower)
+        if option is not None:
+            return option
+
+        for search_blob, option in self._alias_search:
+            if alias_lower in search_blob:
+                return option
+
+        raise ValueError(f'No boot option found with alias: {alias}')